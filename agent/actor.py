@@ -3,10 +3,12 @@ AMEN - On-Chain Actor
 Executes protective actions on blockchain
 """
 
-from typing import Optional
+from typing import List, Optional, Tuple
+import requests
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
 from eth_account import Account
+from eth_abi import encode as abi_encode
 import structlog
 
 from config import AgentConfig
@@ -16,6 +18,14 @@ from abis import ORACLE_ABI, AMM_ABI, VAULT_ABI
 
 logger = structlog.get_logger()
 
+# Function selectors for every action, computed once; calldata is built as
+# selector + encoded args instead of going through contract.functions.*
+PAUSE_WITH_REASON_SELECTOR = Web3.keccak(text="pause(string)")[:4]
+PAUSE_SELECTOR = Web3.keccak(text="pause()")[:4]
+UNPAUSE_SELECTOR = Web3.keccak(text="unpause()")[:4]
+BLOCK_LIQUIDATIONS_SELECTOR = Web3.keccak(text="blockLiquidations()")[:4]
+FLAG_MANIPULATION_SELECTOR = Web3.keccak(text="flagManipulation(string)")[:4]
+
 
 class Actor:
     """
@@ -29,6 +39,9 @@ class Actor:
     All actions are signed and broadcast to the blockchain.
     """
     
+    # Priority fee (tip) added on top of the base fee for every action
+    PRIORITY_FEE = Web3.to_wei(1.5, 'gwei')
+    
     def __init__(self, config: AgentConfig):
         self.config = config
         
@@ -45,6 +58,13 @@ class Actor:
         )
         self.w3.eth.default_account = self.account.address
         
+        # Chain ID never changes; pass it to build_transaction so it doesn't
+        # issue an eth_chainId RPC for every action
+        self.chain_id = self.w3.eth.chain_id
+        
+        # Keep-alive session for JSON-RPC batch submissions
+        self.rpc_session = requests.Session()
+        
         logger.info(
             "Actor initialized",
             agent_address=self.account.address,
@@ -73,17 +93,90 @@ class Actor:
         latest_block = self.w3.eth.get_block('latest')
         base_fee = latest_block.get('baseFeePerGas', self.w3.to_wei(1, 'gwei'))
         
-        # Priority fee (tip)
-        priority_fee = self.w3.to_wei(1.5, 'gwei')
-        
         # Max fee = 2x base fee + priority fee
-        max_fee = (base_fee * 2) + priority_fee
+        max_fee = (base_fee * 2) + self.PRIORITY_FEE
         
         return {
+            'chainId': self.chain_id,
             'maxFeePerGas': max_fee,
-            'maxPriorityFeePerGas': priority_fee,
+            'maxPriorityFeePerGas': self.PRIORITY_FEE,
+        }
+    
+    def _build_tx(
+        self,
+        to: str,
+        data: bytes,
+        gas: int,
+        nonce: Optional[int] = None,
+        gas_params: Optional[dict] = None
+    ) -> dict:
+        """Build a raw transaction dict from precomputed calldata"""
+        if nonce is None:
+            nonce = self.w3.eth.get_transaction_count(self.account.address)
+        return {
+            'to': to,
+            'from': self.account.address,
+            'data': data,
+            'value': 0,
+            'nonce': nonce,
+            'gas': gas,
+            **(gas_params or self._get_gas_params())
         }
     
+    def _send_raw_batch(self, txs: List[dict]) -> List[str]:
+        """
+        Sign transactions and submit them in a single JSON-RPC batch
+        
+        Returns one entry per transaction: the tx hash, or the RPC error
+        message prefixed with "error:" if that submission was rejected.
+        Endpoints that don't accept batches get the transactions one by one.
+        """
+        raw_txs = [
+            Web3.to_hex(self.account.sign_transaction(tx).raw_transaction)
+            for tx in txs
+        ]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_sendRawTransaction",
+                "params": [raw_tx]
+            }
+            for i, raw_tx in enumerate(raw_txs)
+        ]
+        response = self.rpc_session.post(self.config.sepolia_rpc_url, json=payload, timeout=30)
+        
+        replies = None
+        if response.ok:
+            try:
+                replies = response.json()
+            except ValueError:
+                pass
+        if not isinstance(replies, list):
+            # Batch refused (HTTP error or a single error object): nothing was
+            # submitted, so send the same signed transactions sequentially
+            logger.warning(
+                "RPC endpoint rejected batch, sending sequentially",
+                status=response.status_code
+            )
+            return [self._send_raw(raw_tx) for raw_tx in raw_txs]
+        
+        # Batch replies may come back in any order
+        results = {}
+        for reply in replies:
+            if "error" in reply:
+                results[reply["id"]] = f"error:{reply['error'].get('message', reply['error'])}"
+            else:
+                results[reply["id"]] = reply["result"]
+        return [results.get(i, "error:no reply") for i in range(len(txs))]
+    
+    def _send_raw(self, raw_tx: str) -> str:
+        """Submit one signed transaction; same return convention as _send_raw_batch"""
+        try:
+            return Web3.to_hex(self.w3.eth.send_raw_transaction(raw_tx))
+        except Exception as e:
+            return f"error:{e}"
+    
     async def execute(self, decision: PolicyDecision) -> Optional[str]:
         """
         Execute policy decision on-chain
@@ -141,17 +234,14 @@ class Actor:
         reason_truncated = reason[:200] if len(reason) > 200 else reason
         
         # Build transaction
-        gas_params = self._get_gas_params()
-        
-        tx = self.vault.functions.pause(reason_truncated).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 150000,  # Reasonable gas limit for pause
-            **gas_params
-        })
+        tx = self._build_tx(
+            self.vault.address,
+            PAUSE_WITH_REASON_SELECTOR + abi_encode(['string'], [reason_truncated]),
+            150000  # Reasonable gas limit for pause
+        )
         
         # Sign and send
-        signed_tx = self.w3.eth.account.sign_transaction(tx, self.config.agent_private_key)
+        signed_tx = self.account.sign_transaction(tx)
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
         # Wait for confirmation
@@ -178,16 +268,9 @@ class Actor:
         """
         logger.warning("⚠️ BLOCKING LIQUIDATIONS")
         
-        gas_params = self._get_gas_params()
-        
-        tx = self.vault.functions.blockLiquidations().build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 100000,
-            **gas_params
-        })
+        tx = self._build_tx(self.vault.address, BLOCK_LIQUIDATIONS_SELECTOR, 100000)
         
-        signed_tx = self.w3.eth.account.sign_transaction(tx, self.config.agent_private_key)
+        signed_tx = self.account.sign_transaction(tx)
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -210,17 +293,10 @@ class Actor:
         """
         logger.warning("🚨🚨🚨 EMERGENCY AMM PAUSE - BLOCKING ATTACK 🚨🚨🚨")
         
-        gas_params = self._get_gas_params()
-        
         try:
-            tx = self.amm.functions.pause().build_transaction({
-                'from': self.account.address,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                'gas': 100000,
-                **gas_params
-            })
+            tx = self._build_tx(self.amm.address, PAUSE_SELECTOR, 100000)
             
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.config.agent_private_key)
+            signed_tx = self.account.sign_transaction(tx)
             tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
             
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -241,6 +317,45 @@ class Actor:
                 return "already_paused"
             raise
 
+    async def lockdown(self) -> Tuple[str, Optional[str]]:
+        """
+        EMERGENCY: Pause the AMM and block liquidations together
+        
+        Both transactions get consecutive nonces and are submitted in one
+        JSON-RPC batch, so they confirm in the same block instead of one
+        after the other.
+        
+        Returns:
+            (AMM pause tx hash, liquidation block tx hash or None if rejected)
+        """
+        logger.warning("🚨🚨🚨 EMERGENCY LOCKDOWN - PAUSING AMM + BLOCKING LIQUIDATIONS 🚨🚨🚨")
+        
+        nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+        gas_params = self._get_gas_params()
+        
+        amm_hash, liq_hash = self._send_raw_batch([
+            self._build_tx(self.amm.address, PAUSE_SELECTOR, 100000, nonce, gas_params),
+            self._build_tx(self.vault.address, BLOCK_LIQUIDATIONS_SELECTOR, 100000, nonce + 1, gas_params),
+        ])
+        
+        if amm_hash.startswith("error:"):
+            raise RuntimeError(amm_hash[len("error:"):])
+        if liq_hash.startswith("error:"):
+            logger.error("❌ Block liquidations rejected", error=liq_hash[len("error:"):])
+            liq_hash = None
+        
+        # Nonce order means the liquidation block lands with or after the pause
+        for label, tx_hash in (("AMM pause", amm_hash), ("Liquidation block", liq_hash)):
+            if tx_hash is None:
+                continue
+            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            if receipt.status == 1:
+                logger.info(f"🛡️ {label} confirmed", tx_hash=tx_hash, block=receipt.blockNumber)
+            else:
+                logger.error(f"❌ {label} failed", tx_hash=tx_hash)
+        
+        return amm_hash, liq_hash
+    
     async def unpause_amm(self) -> str:
         """
         Resume AMM operations after security review
@@ -248,16 +363,9 @@ class Actor:
         """
         logger.info("🔓 Unpausing AMM...")
         
-        gas_params = self._get_gas_params()
-        
-        tx = self.amm.functions.unpause().build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 100000,
-            **gas_params
-        })
+        tx = self._build_tx(self.amm.address, UNPAUSE_SELECTOR, 100000)
         
-        signed_tx = self.w3.eth.account.sign_transaction(tx, self.config.agent_private_key)
+        signed_tx = self.account.sign_transaction(tx)
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -275,16 +383,13 @@ class Actor:
         
         reason_truncated = reason[:200] if len(reason) > 200 else reason
         
-        gas_params = self._get_gas_params()
-        
-        tx = self.oracle.functions.flagManipulation(reason_truncated).build_transaction({
-            'from': self.account.address,
-            'nonce': self.w3.eth.get_transaction_count(self.account.address),
-            'gas': 100000,
-            **gas_params
-        })
+        tx = self._build_tx(
+            self.oracle.address,
+            FLAG_MANIPULATION_SELECTOR + abi_encode(['string'], [reason_truncated]),
+            100000
+        )
         
-        signed_tx = self.w3.eth.account.sign_transaction(tx, self.config.agent_private_key)
+        signed_tx = self.account.sign_transaction(tx)
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
         
         receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
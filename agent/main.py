@@ -136,22 +136,18 @@ class AMENAgent:
                 console.print(f"  [bold red]   Deviation: {snapshot.price_deviation_pct:.1f}% > {proactive_threshold:.1f}% threshold[/bold red]")
                 console.print(f"  [bold red]   ACTIVATING PROACTIVE DEFENSE![/bold red]")
                 
-                # Immediately pause AMM - no LLM needed for obvious attacks
+                # Immediately pause AMM and block liquidations - no LLM needed
+                # for obvious attacks; both txs go out in one batch
                 try:
-                    amm_tx = await self.actor.pause_amm()
+                    amm_tx, liq_tx = await self.actor.lockdown()
                     console.print(f"  [bold green]🛡️ AMM PAUSED PROACTIVELY! TX: {amm_tx}[/bold green]")
                     self.actions_taken += 1
                     
-                    # Also block liquidations
-                    try:
-                        liq_tx = await self.actor._block_liquidations()
+                    if liq_tx:
                         console.print(f"  [bold green]🛡️ LIQUIDATIONS BLOCKED! TX: {liq_tx}[/bold green]")
                         self.actions_taken += 1
-                    except Exception as e:
-                        if "already blocked" in str(e).lower():
-                            console.print(f"  [yellow]ℹ️ Liquidations already blocked[/yellow]")
-                        else:
-                            console.print(f"  [red]⚠️ Could not block liquidations: {e}[/red]")
+                    else:
+                        console.print(f"  [red]⚠️ Could not block liquidations[/red]")
                     
                     # Report the proactive action
                     await self.reporter.report_proactive_defense(snapshot, snapshot.price_deviation_pct, amm_tx)
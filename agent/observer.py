@@ -5,7 +5,7 @@ Collects real-time data from blockchain for threat analysis
 
 import asyncio
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from web3 import Web3
 from web3.contract import Contract
@@ -308,7 +308,7 @@ class Observer:
         
         # Create snapshot
         snapshot = MarketSnapshot(
-            timestamp=datetime.now(),
+            timestamp=datetime.now(timezone.utc),
             block_number=current_block,
             
             oracle_price=oracle_data.price,
@@ -7,7 +7,9 @@ import json
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+import orjson
 import structlog
+import xxhash
 from google import genai
 from google.genai import types
 
@@ -17,6 +19,14 @@ from config import AgentConfig
 logger = structlog.get_logger()
 
 
+# Context sections that identify a market state for deduplication.
+# Everything else (price history, reserves, wall-clock timestamps) is noise.
+_DEDUP_KEYS = ("current_state", "activity_metrics", "anomaly_indicators")
+# current_state fields that change every block; hashing them would make every
+# block's context unique (repeats within one block are caught by last_llm_block)
+_DEDUP_PER_BLOCK_FIELDS = frozenset(("block_number", "timestamp"))
+
+
 class ThreatClassification(Enum):
     """Threat classification types"""
     NATURAL = "NATURAL"
@@ -24,6 +34,9 @@ class ThreatClassification(Enum):
     FLASH_LOAN_ATTACK = "FLASH_LOAN_ATTACK"
 
 
+_CLASSIFICATION_LUT = {c.value: c for c in ThreatClassification}
+
+
 @dataclass
 class ThreatAssessment:
     """
@@ -113,6 +126,7 @@ class Reasoner:
         # LLM call tracking for deduplication
         self.last_llm_block: int = 0
         self.last_llm_call_hash: Optional[str] = None
+        self.last_llm_assessment: Optional[ThreatAssessment] = None
         self.llm_calls_count: int = 0
         self.blocks_processed: int = 0
         
@@ -181,9 +195,8 @@ Analyze this data for potential manipulation attacks. Respond with JSON only."""
                 )
         
         # Parse classification
-        try:
-            classification = ThreatClassification(data["classification"])
-        except ValueError:
+        classification = _CLASSIFICATION_LUT.get(str(data["classification"]))
+        if classification is None:
             logger.error("Invalid classification", value=data["classification"])
             classification = ThreatClassification.NATURAL
         
@@ -235,24 +248,25 @@ Analyze this data for potential manipulation attacks. Respond with JSON only."""
                 evidence=[]
             )
         
-        # Generate content hash for deduplication
-        import hashlib
-        content_hash = hashlib.sha256(
-            json.dumps(context, sort_keys=True).encode()
-        ).hexdigest()[:16]
+        # Generate content hash for deduplication (stable fields only)
+        dedup_view = {k: context.get(k) for k in _DEDUP_KEYS}
+        dedup_view["current_state"] = {
+            k: v for k, v in (dedup_view["current_state"] or {}).items()
+            if k not in _DEDUP_PER_BLOCK_FIELDS
+        }
+        content_hash = xxhash.xxh3_64_hexdigest(
+            orjson.dumps(dedup_view, option=orjson.OPT_SORT_KEYS)
+        )
         
-        if content_hash == self.last_llm_call_hash:
+        # Identical context: reuse the previous verdict rather than
+        # downgrading a standing threat to NATURAL
+        if content_hash == self.last_llm_call_hash and self.last_llm_assessment:
             logger.warning(
                 "Skipping LLM call - identical context",
                 block=current_block,
                 hash=content_hash
             )
-            return ThreatAssessment(
-                classification=ThreatClassification.NATURAL,
-                confidence=0.0,
-                explanation="Identical context already analyzed",
-                evidence=[]
-            )
+            return self.last_llm_assessment
         
         prompt = self._build_analysis_prompt(context)
         
@@ -260,7 +274,6 @@ Analyze this data for potential manipulation attacks. Respond with JSON only."""
             # Track LLM call
             self.llm_calls_count += 1
             self.last_llm_block = current_block
-            self.last_llm_call_hash = content_hash
             
             logger.info(
                 "🤖 CALLING GEMINI LLM",
@@ -296,6 +309,8 @@ Analyze this data for potential manipulation attacks. Respond with JSON only."""
             
             # Parse into structured assessment
             assessment = self._parse_response(response.text)
+            self.last_llm_call_hash = content_hash
+            self.last_llm_assessment = assessment
             
             logger.info(
                 "✅ Threat assessment completed",
@@ -4,8 +4,10 @@ Logs events and sends reports to backend
 """
 
 import asyncio
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Deque, Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 import json
 import httpx
@@ -65,7 +67,7 @@ class Reporter:
     def __init__(self, config: AgentConfig):
         self.config = config
         self.backend_url = config.backend_url
-        self.event_history: List[SecurityEvent] = []
+        self.event_history: Deque[SecurityEvent] = deque(maxlen=1000)
         
         # HTTP client for backend communication
         self.client = httpx.AsyncClient(
@@ -96,7 +98,7 @@ class Reporter:
     ) -> SecurityEvent:
         """Report a threat assessment"""
         event = SecurityEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             block_number=snapshot.block_number,
             event_type="ASSESSMENT",
             oracle_price=snapshot.oracle_price,
@@ -119,7 +121,7 @@ class Reporter:
     ) -> SecurityEvent:
         """Report a policy decision"""
         event = SecurityEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             block_number=snapshot.block_number,
             event_type="DECISION",
             oracle_price=snapshot.oracle_price,
@@ -145,7 +147,7 @@ class Reporter:
     ) -> SecurityEvent:
         """Report an executed on-chain action"""
         event = SecurityEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             block_number=snapshot.block_number,
             event_type="ACTION",
             oracle_price=snapshot.oracle_price,
@@ -170,7 +172,7 @@ class Reporter:
     ) -> SecurityEvent:
         """Report AMM emergency pause - ATTACK BLOCKED!"""
         event = SecurityEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             block_number=snapshot.block_number,
             event_type="AMM_PAUSED",
             oracle_price=snapshot.oracle_price,
@@ -204,7 +206,7 @@ class Reporter:
     ) -> SecurityEvent:
         """Report proactive defense activation - immediate AMM pause on large deviation"""
         event = SecurityEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
             block_number=snapshot.block_number,
             event_type="PROACTIVE_DEFENSE",
             oracle_price=snapshot.oracle_price,
@@ -240,8 +242,6 @@ class Reporter:
         """Log event locally and send to backend"""
         # Store in history
         self.event_history.append(event)
-        if len(self.event_history) > 1000:
-            self.event_history.pop(0)
         
         # Log locally based on event type
         if event.event_type == "ACTION":
@@ -295,7 +295,8 @@ class Reporter:
     
     async def get_recent_events(self, count: int = 50) -> List[Dict[str, Any]]:
         """Get recent events from history"""
-        return [e.to_dict() for e in self.event_history[-count:]]
+        start = max(0, len(self.event_history) - count)
+        return [e.to_dict() for e in islice(self.event_history, start, None)]
     
     async def close(self) -> None:
         """Close HTTP client"""
@@ -5,28 +5,42 @@ REST API for security event logging and dashboard data
 
 import os
 import asyncio
-import json
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import hashlib
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+import aiohttp
+import msgspec
+import orjson
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy import select, desc, func, and_, true, bindparam
 from dotenv import load_dotenv
-from web3 import Web3
+from web3 import AsyncWeb3, AsyncHTTPProvider, Web3
+from eth_abi import decode as abi_decode, encode as abi_encode
+from web3.exceptions import ContractLogicError
 
 from models import (
     Base, 
     SecurityEvent, 
+    ThreatTimeline,
     MarketSnapshot, 
     AgentAction,
-    get_database_url,
-    create_tables
+    get_async_engine,
+    get_async_session_factory,
+    create_tables,
+    bulk_insert,
+    maintain_partitions,
+    NON_THREAT_CLASSIFICATIONS,
+    TX_HASH_PATTERN,
+    THREAT_TIMELINE_COLUMNS
 )
 
 # Load environment
@@ -34,58 +48,151 @@ load_dotenv("../.env")
 
 # Initialize Web3 for blockchain queries
 RPC_URL = os.getenv("SEPOLIA_RPC_URL", "https://eth-sepolia.g.alchemy.com/v2/DsAGO4co8iV4lmwiZYHW8")
-w3 = Web3(Web3.HTTPProvider(RPC_URL))
+w3 = AsyncWeb3(AsyncHTTPProvider(RPC_URL, request_kwargs={"timeout": aiohttp.ClientTimeout(total=10)}))
 
 # Load contract addresses
 DEPLOYMENT_FILE = os.path.join(os.path.dirname(__file__), "..", "contracts", "deployments", "sepolia-deployment.json")
-CONTRACT_ADDRESSES = {}
-try:
-    with open(DEPLOYMENT_FILE) as f:
-        CONTRACT_ADDRESSES = json.load(f).get("contracts", {})
-except:
-    pass
-
-# Simple ABI for paused() function
-PAUSED_ABI = [{"inputs": [], "name": "paused", "outputs": [{"type": "bool"}], "stateMutability": "view", "type": "function"}]
-LIQUIDATIONS_BLOCKED_ABI = [{"inputs": [], "name": "liquidationsBlocked", "outputs": [{"type": "bool"}], "stateMutability": "view", "type": "function"}]
 
-
-def get_blockchain_state():
-    """Query blockchain for current paused state"""
-    amm_paused = False
-    vault_paused = False
-    liquidations_blocked = False
+# Last resort when neither the environment nor the deployment file has an address
+DEFAULT_CONTRACT_ADDRESSES = {
+    "WETH": "0x7E8c42a6F66c2225015FDFf0814D7c1BaCc4A9d2",
+    "USDC": "0xd333C2bfD3780Cb9eaf1a21B3EA856cBbf8479E1",
+    "ORACLE": "0x0b939bbab85d69A27df77b45c1e5b7E8B5FB3D3f",
+    "AMM": "0x0Db2401DA9810F7f1023D8df8D52328E3A0f92Cd",
+    "LENDING_VAULT": "0x09aEaE5751AFbc19A20f75eFd63B7431c094224c"
+}
+
+# Deployment file key -> environment variable (same names as the agent's .env)
+CONTRACT_ADDRESS_ENV = {
+    "WETH": "WETH_ADDRESS",
+    "USDC": "USDC_ADDRESS",
+    "ORACLE": "ORACLE_ADDRESS",
+    "AMM": "AMM_POOL_ADDRESS",
+    "LENDING_VAULT": "LENDING_VAULT_ADDRESS"
+}
+
+
+def resolve_contract_addresses() -> Dict[str, str]:
+    """Contract addresses: env var, then deployment JSON, then Sepolia defaults"""
+    addresses = dict(DEFAULT_CONTRACT_ADDRESSES)
     
     try:
-        if CONTRACT_ADDRESSES.get("AMM"):
-            amm = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESSES["AMM"]), abi=PAUSED_ABI)
-            amm_paused = amm.functions.paused().call()
-    except Exception as e:
+        with open(DEPLOYMENT_FILE, "rb") as f:
+            addresses.update(orjson.loads(f.read()).get("contracts", {}))
+    except (OSError, orjson.JSONDecodeError):
         pass
     
-    try:
-        if CONTRACT_ADDRESSES.get("LENDING_VAULT"):
-            vault = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESSES["LENDING_VAULT"]), abi=PAUSED_ABI)
-            vault_paused = vault.functions.paused().call()
-    except:
-        pass
+    for name, env_var in CONTRACT_ADDRESS_ENV.items():
+        if os.getenv(env_var):
+            addresses[name] = os.getenv(env_var)
     
+    return addresses
+
+
+CONTRACT_ADDRESSES = resolve_contract_addresses()
+
+# Canonical Multicall3 deployment (same address on every EVM chain)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [{
+    "inputs": [{"components": [
+        {"name": "target", "type": "address"},
+        {"name": "allowFailure", "type": "bool"},
+        {"name": "callData", "type": "bytes"}
+    ], "name": "calls", "type": "tuple[]"}],
+    "name": "aggregate3",
+    "outputs": [{"components": [
+        {"name": "success", "type": "bool"},
+        {"name": "returnData", "type": "bytes"}
+    ], "name": "returnData", "type": "tuple[]"}],
+    "stateMutability": "payable",
+    "type": "function"
+}]
+
+# Pre-encoded calldata for the view functions we poll
+PAUSED_CALLDATA = bytes(Web3.keccak(text="paused()")[:4])
+LIQUIDATIONS_BLOCKED_CALLDATA = bytes(Web3.keccak(text="liquidationsBlocked()")[:4])
+
+
+def _build_state_calls():
+    """(state key, Multicall3 call) pairs for the pause flags we poll"""
+    calls = []
     try:
+        if CONTRACT_ADDRESSES.get("AMM"):
+            amm_address = Web3.to_checksum_address(CONTRACT_ADDRESSES["AMM"])
+            calls.append(("amm_paused", (amm_address, True, PAUSED_CALLDATA)))
         if CONTRACT_ADDRESSES.get("LENDING_VAULT"):
-            vault = w3.eth.contract(address=Web3.to_checksum_address(CONTRACT_ADDRESSES["LENDING_VAULT"]), abi=LIQUIDATIONS_BLOCKED_ABI)
-            liquidations_blocked = vault.functions.liquidationsBlocked().call()
-    except:
+            vault_address = Web3.to_checksum_address(CONTRACT_ADDRESSES["LENDING_VAULT"])
+            calls.append(("vault_paused", (vault_address, True, PAUSED_CALLDATA)))
+            calls.append(("liquidations_blocked", (vault_address, True, LIQUIDATIONS_BLOCKED_CALLDATA)))
+    except ValueError:
         pass
+    return calls
+
+
+# Addresses are static, so checksum them and build the aggregate call once
+_STATE_CALLS = _build_state_calls()
+_STATE_AGGREGATE = (
+    w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    .functions.aggregate3([call for _, call in _STATE_CALLS])
+    if _STATE_CALLS else None
+)
+
+
+# On-chain pause state changes far less often than the dashboard polls
+BLOCKCHAIN_STATE_TTL = 3.0
+_state_cache = {"t": 0.0, "v": (False, False, False)}
+_state_lock = asyncio.Lock()
+
+
+async def _fetch_blockchain_state():
+    """Query blockchain for current paused state (one Multicall3 round-trip)"""
+    state = {"amm_paused": False, "vault_paused": False, "liquidations_blocked": False}
+    
+    if _STATE_AGGREGATE is not None:
+        try:
+            results = await _STATE_AGGREGATE.call()
+            
+            # allowFailure=True: a reverted call leaves its default in place
+            for (name, _), (success, return_data) in zip(_STATE_CALLS, results):
+                if success and return_data:
+                    state[name] = abi_decode(["bool"], return_data)[0]
+        except Exception:
+            pass
+    
+    return state["amm_paused"], state["vault_paused"], state["liquidations_blocked"]
+
+
+async def get_blockchain_state():
+    """Get blockchain paused state, cached for BLOCKCHAIN_STATE_TTL seconds"""
+    if time.monotonic() - _state_cache["t"] < BLOCKCHAIN_STATE_TTL:
+        return _state_cache["v"]
     
-    return amm_paused, vault_paused, liquidations_blocked
+    async with _state_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() - _state_cache["t"] < BLOCKCHAIN_STATE_TTL:
+            return _state_cache["v"]
+        
+        value = await _fetch_blockchain_state()
+        _state_cache["t"] = time.monotonic()
+        _state_cache["v"] = value
+        return value
+
+
+def invalidate_blockchain_state():
+    """Force the next get_blockchain_state() call to hit the chain"""
+    _state_cache["t"] = 0.0
 
 
 # =============================================================================
-# PYDANTIC MODELS
+# REQUEST / RESPONSE MODELS
 # =============================================================================
 
-class SecurityEventCreate(BaseModel):
-    """Input model for creating security events"""
+class SecurityEventCreate(msgspec.Struct):
+    """
+    Input model for creating security events
+    msgspec Struct: POST /api/events is hit on every agent observation,
+    and msgspec parses + validates the body in a single pass
+    """
     timestamp: str
     block_number: int
     event_type: str
@@ -102,6 +209,12 @@ class SecurityEventCreate(BaseModel):
     tx_hash: Optional[str] = None
 
 
+SECURITY_EVENT_DECODER = msgspec.json.Decoder(SecurityEventCreate)
+SECURITY_EVENT_SCHEMA = msgspec.json.schema_components([SecurityEventCreate])[1]["SecurityEventCreate"]
+
+
+# Pydantic response models are only used to document the API (OpenAPI)
+
 class SecurityEventResponse(BaseModel):
     """Response model for security events"""
     id: int
@@ -160,28 +273,122 @@ class ThreatTimelineEntry(BaseModel):
 # Create engine and session factory
 engine = None
 async_session_factory = None
+# Sync engine from create_tables(), used for DDL maintenance
+sync_engine = None
+
+# Seconds between partition maintenance runs (new months, retention)
+PARTITION_MAINTENANCE_INTERVAL = 3600
 
 
 async def init_db():
     """Initialize database"""
-    global engine, async_session_factory
+    global engine, async_session_factory, sync_engine
     
     # Create tables using sync engine first
-    create_tables()
+    sync_engine = create_tables()
     
-    # Create async engine
-    db_url = get_database_url(use_async=True)
-    engine = create_async_engine(db_url, echo=False)
+    # Share the pooled async engine owned by models
+    engine = get_async_engine()
+    async_session_factory = get_async_session_factory()
+
+
+async def partition_maintenance():
+    """
+    Background task: keep monthly partitions ahead of the clock
+    Without it, a long-running backend would outlive the months created at
+    startup and start filling the DEFAULT partition.
+    """
+    while True:
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL)
+        try:
+            await asyncio.to_thread(maintain_partitions, sync_engine)
+        except Exception as e:
+            print(f"Partition maintenance failed: {e}")
+
+
+# =============================================================================
+# EVENT INGESTION
+# =============================================================================
+
+# Events are written by a single background writer that group-commits whatever
+# has queued up: concurrent POSTs share one INSERT ... RETURNING executemany
+# and one commit instead of a transaction each. Each request still waits for
+# its own row, so the response keeps the assigned id.
+
+# Most events written per transaction
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "500"))
+# Seconds the writer holds a non-full batch open for more events; 0 batches only
+# what is already queued, so a lone event is written without added latency
+INGEST_MAX_WAIT = float(os.getenv("INGEST_MAX_WAIT", "0"))
+
+ingest_queue: Optional[asyncio.Queue] = None
+_ingest_task: Optional[asyncio.Task] = None
+
+
+async def drain(queue: asyncio.Queue, max_n: int, max_wait: float) -> list:
+    """Wait for one item, then take up to max_n - 1 more within max_wait seconds"""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
     
-    async_session_factory = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    while len(batch) < max_n:
+        try:
+            batch.append(queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    
+    return batch
 
 
-async def get_session() -> AsyncSession:
-    """Get database session"""
+async def write_events(payloads: List[Dict[str, Any]]) -> List[SecurityEvent]:
+    """Insert a batch of events (and their threat timeline rows) in one transaction"""
     async with async_session_factory() as session:
-        yield session
+        events = await SecurityEvent.create_many(session, payloads)
+        
+        # Keep the threat timeline in step, in the same transaction. Nothing is
+        # read back, so large batches can use COPY on PostgreSQL.
+        await bulk_insert(session, ThreatTimeline, [
+            {name: getattr(event, name) for name in THREAT_TIMELINE_COLUMNS}
+            for event in events
+            if event.classification not in NON_THREAT_CLASSIFICATIONS
+        ])
+        
+        await session.commit()
+    
+    return events
+
+
+async def ingest_writer():
+    """Background task: flush queued events in batches"""
+    while True:
+        batch = await drain(ingest_queue, INGEST_BATCH_SIZE, INGEST_MAX_WAIT)
+        try:
+            events = await write_events([payload for payload, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            continue
+        
+        invalidate_response_cache()
+        for (_, future), event in zip(batch, events):
+            if not future.done():
+                future.set_result(event)
+
+
+async def ingest_event(payload: Dict[str, Any]) -> SecurityEvent:
+    """Queue an event for the writer and wait until it is committed"""
+    future = asyncio.get_running_loop().create_future()
+    ingest_queue.put_nowait((payload, future))
+    return await future
 
 
 # =============================================================================
@@ -191,23 +398,71 @@ async def get_session() -> AsyncSession:
 class ConnectionManager:
     """WebSocket connection manager for real-time updates"""
     
+    # Messages buffered per client before its oldest one is dropped
+    QUEUE_SIZE = 64
+    # A client that can't accept a frame within this many seconds is dropped
+    SEND_TIMEOUT = 5.0
+    # Close code for dropped clients (1013 Try Again Later): tells the browser
+    # to reconnect rather than leaving it on a socket nobody writes to
+    DROP_CLOSE_CODE = 1013
+    
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # websocket -> (outgoing queue, writer task); dict gives O(1) disconnect
+        self.active_connections: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        self._lock = asyncio.Lock()
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        writer = asyncio.create_task(self._writer(websocket, queue))
+        async with self._lock:
+            self.active_connections[websocket] = (queue, writer)
     
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+    async def disconnect(self, websocket: WebSocket):
+        async with self._lock:
+            entry = self.active_connections.pop(websocket, None)
+        if entry and entry[1] is not asyncio.current_task():
+            entry[1].cancel()
     
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued messages to one client; a failed or stalled send drops the client"""
+        try:
+            while True:
+                payload = await queue.get()
+                await asyncio.wait_for(websocket.send_text(payload), self.SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            await self.disconnect(websocket)
             try:
-                await connection.send_json(message)
-            except:
+                await asyncio.wait_for(websocket.close(code=self.DROP_CLOSE_CODE), self.SEND_TIMEOUT)
+            except Exception:
+                # Already gone or unresponsive; the receive loop ends either way
                 pass
+    
+    async def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for a single client"""
+        await self.send_raw(websocket, orjson.dumps(message).decode())
+    
+    async def send_raw(self, websocket: WebSocket, payload: str):
+        """Queue an already-serialized frame for a single client"""
+        entry = self.active_connections.get(websocket)
+        if entry and not entry[0].full():
+            entry[0].put_nowait(payload)
+    
+    async def broadcast(self, message: dict):
+        """Broadcast message to all connected clients"""
+        # Serialize once; every client gets the same text frame
+        await self.broadcast_raw(orjson.dumps(message).decode())
+    
+    async def broadcast_raw(self, payload: str):
+        """Broadcast an already-serialized JSON message to all connected clients"""
+        # Snapshot so connects/disconnects can't mutate us mid-iteration
+        for queue, _ in tuple(self.active_connections.values()):
+            if queue.full():
+                # Slow client: drop its oldest message rather than stall everyone
+                queue.get_nowait()
+            queue.put_nowait(payload)
 
 
 manager = ConnectionManager()
@@ -221,9 +476,24 @@ manager = ConnectionManager()
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
+    global ingest_queue, _ingest_task
     await init_db()
+    
+    ingest_queue = asyncio.Queue()
+    _ingest_task = asyncio.create_task(ingest_writer())
+    partition_task = asyncio.create_task(partition_maintenance())
+    
+    # One pooled keep-alive session for all RPC calls (reuses the TLS connection)
+    rpc_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=60)
+    )
+    await w3.provider.cache_async_session(rpc_session)
+    
     yield
     # Shutdown
+    _ingest_task.cancel()
+    partition_task.cancel()
+    await rpc_session.close()
     if engine:
         await engine.dispose()
 
@@ -232,7 +502,8 @@ app = FastAPI(
     title="AMEN Security Backend",
     description="API for DeFi security monitoring and event logging",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS configuration
@@ -247,6 +518,80 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# HTTP CACHING
+# =============================================================================
+
+# Always revalidate: a WebSocket new_event triggers an immediate refetch, which
+# must reach the server. Unchanged data still costs only a 304 via the ETag.
+HTTP_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the values that determine a response body"""
+    digest = hashlib.blake2b(":".join(str(p) for p in parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+
+
+# Short-lived server-side cache for read endpoints: results only change at
+# block cadence or when the agent posts an event (which clears it), so
+# concurrent pollers share one DB/RPC round-trip per TTL window
+RESPONSE_CACHE_TTL = 3.0
+RESPONSE_CACHE_MAX_ENTRIES = 256
+_response_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def get_cached_response(key: str) -> Any:
+    """Return the cached value for key, or None if missing/expired"""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def set_cached_response(key: str, value: Any):
+    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.clear()
+    _response_cache[key] = (time.monotonic(), value)
+
+
+def invalidate_response_cache():
+    _response_cache.clear()
+
+
+# =============================================================================
+# LIVE STATS
+# =============================================================================
+
+# Dashboard stats are pushed to WebSocket clients after every new event and
+# chain change, so dashboards don't poll /api/stats. The pushed payload is the
+# same TTL-cached compute_stats() result /api/stats serves.
+_stats_tasks: set = set()
+
+
+async def push_stats():
+    """Push current stats to all clients"""
+    await manager.broadcast({"type": "stats", "data": await current_stats()})
+
+
+def schedule_stats_push():
+    """Push stats in the background so event ingestion never waits on the RPC"""
+    task = asyncio.create_task(push_stats())
+    _stats_tasks.add(task)
+    task.add_done_callback(_stats_tasks.discard)
+
+
+def refresh_chain_views():
+    """After a chain write: drop cached chain state and push fresh stats to dashboards"""
+    invalidate_blockchain_state()
+    invalidate_response_cache()
+    schedule_stats_push()
+
+
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
@@ -261,245 +606,544 @@ async def root():
     }
 
 
-@app.post("/api/events", response_model=SecurityEventResponse)
-async def create_event(
-    event: SecurityEventCreate,
-    session: AsyncSession = Depends(get_session)
-):
+@app.post(
+    "/api/events",
+    responses={200: {"model": SecurityEventResponse}},
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": SECURITY_EVENT_SCHEMA}}
+        }
+    }
+)
+async def create_event(request: Request):
     """
     Create a new security event
     Called by the agent to log observations, assessments, and actions
     """
+    # Validate straight from the raw body (single parse, no dict intermediary)
+    try:
+        event = SECURITY_EVENT_DECODER.decode(await request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(e)}])
+    
     # Parse timestamp
     try:
         timestamp = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
+        if timestamp.tzinfo is None:
+            # Naive timestamps are UTC (the agent sends aware UTC)
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
     except:
-        timestamp = datetime.utcnow()
-    
-    # Create database record
-    db_event = SecurityEvent(
-        timestamp=timestamp,
-        block_number=event.block_number,
-        event_type=event.event_type,
-        oracle_price=event.oracle_price,
-        amm_price=event.amm_price,
-        price_deviation=event.price_deviation,
-        classification=event.classification,
-        confidence=event.confidence,
-        explanation=event.explanation,
-        evidence=event.evidence,
-        action=event.action,
-        action_reason=event.action_reason,
-        execute_on_chain=event.execute_on_chain,
-        tx_hash=event.tx_hash
-    )
+        timestamp = datetime.now(timezone.utc)
+    
+    # Create database record (batched with any concurrent events by the writer)
+    payload = msgspec.structs.asdict(event)
+    payload["timestamp"] = timestamp
     
-    session.add(db_event)
-    await session.commit()
-    await session.refresh(db_event)
+    # tx_hash is stored as 32 raw bytes; a status the agent reports in its place
+    # (e.g. "already_paused") is kept in the evidence instead
+    if payload["tx_hash"] is not None and not TX_HASH_PATTERN.match(payload["tx_hash"]):
+        payload["evidence"] = [*(payload["evidence"] or []), f"tx_status: {payload['tx_hash']}"]
+        payload["tx_hash"] = None
+    
+    db_event = await ingest_event(payload)
+    
+    event_data = db_event.to_dict()
+    
+    # Serialize once: the HTTP body and the WebSocket frame share these bytes
+    event_json = orjson.dumps(event_data)
     
     # Broadcast to WebSocket clients
-    await manager.broadcast({
-        "type": "new_event",
-        "data": db_event.to_dict()
-    })
+    await manager.broadcast_raw(
+        (b'{"type":"new_event","data":' + event_json + b"}").decode()
+    )
+    
+    schedule_stats_push()
+    
+    return Response(content=event_json, media_type="application/json")
+
+
+# Read-only list endpoints select plain columns and read rows as mappings,
+# skipping ORM instance construction and identity-map bookkeeping. Datetimes
+# are left as-is: orjson encodes them natively in ISO 8601.
+SECURITY_EVENT_COLUMNS = tuple(SecurityEvent.__table__.c[name] for name in SecurityEvent.dict_columns)
+
+
+# Base statements are built once at import. Limits and filter values are bound
+# parameters, so each statement shape compiles once and is then served from
+# SQLAlchemy's compiled cache instead of being rebuilt per request.
+EVENTS_QUERY = select(*SECURITY_EVENT_COLUMNS).order_by(desc(SecurityEvent.timestamp))
+
+# Threats come from the pre-filtered threat_timeline table
+THREATS_QUERY = select(
+    ThreatTimeline.timestamp,
+    ThreatTimeline.classification,
+    ThreatTimeline.confidence,
+    ThreatTimeline.action,
+    ThreatTimeline.tx_hash,
+    ThreatTimeline.explanation
+).order_by(desc(ThreatTimeline.timestamp))
+
+ACTION_FILTERS = [SecurityEvent.event_type.in_(["ACTION", "PROACTIVE_DEFENSE", "AMM_PAUSED"])]
+
+
+def threat_row_to_dict(row) -> Dict[str, Any]:
+    """Convert a threat timeline row mapping to the API dict shape"""
+    return {
+        "timestamp": row["timestamp"] or "",
+        "classification": row["classification"] or "",
+        "confidence": row["confidence"] or 0,
+        "action": row["action"],
+        "tx_hash": row["tx_hash"],
+        "explanation": row["explanation"]
+    }
+
+
+async def event_list_response(
+    request: Request,
+    cache_key: str,
+    query,
+    filters: List[Any],
+    row_to_dict: Callable[[Any], Dict[str, Any]],
+    model=SecurityEvent
+) -> Response:
+    """
+    Serve an event list from the short-lived cache, with ETag revalidation
+    The ETag comes from a cheap MAX(id)/COUNT preflight over the same filters
+    (events are append-only), so an unchanged list answers 304 without
+    running the list query or serializing anything
+    """
+    if_none_match = request.headers.get("if-none-match")
+    
+    cached = get_cached_response(cache_key)
+    if cached is None:
+        async with async_session_factory() as session:
+            preflight = await session.execute(
+                select(func.max(model.id), func.count(model.id)).where(*filters)
+            )
+            etag = make_etag(cache_key, *preflight.one())
+            if if_none_match == etag:
+                return Response(status_code=304, headers=cache_headers(etag))
+            
+            result = await session.execute(query.where(*filters))
+            body = orjson.dumps([row_to_dict(row) for row in result.mappings()])
+        
+        cached = (etag, body)
+        set_cached_response(cache_key, cached)
     
-    return SecurityEventResponse(**db_event.to_dict())
+    etag, body = cached
+    headers = cache_headers(etag)
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
-@app.get("/api/events", response_model=List[SecurityEventResponse])
+@app.get("/api/events", responses={200: {"model": List[SecurityEventResponse]}})
 async def get_events(
+    request: Request,
     limit: int = 100,
     event_type: Optional[str] = None,
-    classification: Optional[str] = None,
-    session: AsyncSession = Depends(get_session)
+    classification: Optional[str] = None
 ):
     """Get security events with optional filtering"""
-    query = select(SecurityEvent).order_by(desc(SecurityEvent.timestamp))
-    
+    filters = []
     if event_type:
-        query = query.where(SecurityEvent.event_type == event_type)
+        filters.append(SecurityEvent.event_type == event_type)
     if classification:
-        query = query.where(SecurityEvent.classification == classification)
-    
-    query = query.limit(limit)
+        filters.append(SecurityEvent.classification == classification)
     
-    result = await session.execute(query)
-    events = result.scalars().all()
-    
-    return [SecurityEventResponse(**e.to_dict()) for e in events]
+    return await event_list_response(
+        request, f"events:{limit}:{event_type}:{classification}",
+        EVENTS_QUERY.limit(limit), filters, dict
+    )
 
 
-@app.get("/api/events/threats", response_model=List[ThreatTimelineEntry])
-async def get_threats(
-    limit: int = 50,
-    session: AsyncSession = Depends(get_session)
-):
+@app.get("/api/events/threats", responses={200: {"model": List[ThreatTimelineEntry]}})
+async def get_threats(request: Request, limit: int = 50):
     """Get threat timeline (non-NATURAL classifications)"""
-    query = (
-        select(SecurityEvent)
-        .where(SecurityEvent.classification.isnot(None))
-        .where(SecurityEvent.classification != "NATURAL")
-        .order_by(desc(SecurityEvent.timestamp))
-        .limit(limit)
+    return await event_list_response(
+        request, f"threats:{limit}", THREATS_QUERY.limit(limit), [], threat_row_to_dict,
+        model=ThreatTimeline
     )
-    
-    result = await session.execute(query)
-    events = result.scalars().all()
-    
-    return [
-        ThreatTimelineEntry(
-            timestamp=e.timestamp.isoformat() if e.timestamp else "",
-            classification=e.classification or "",
-            confidence=e.confidence or 0,
-            action=e.action,
-            tx_hash=e.tx_hash,
-            explanation=e.explanation
-        )
-        for e in events
-    ]
 
 
-@app.get("/api/events/actions", response_model=List[SecurityEventResponse])
-async def get_actions(
-    limit: int = 50,
-    session: AsyncSession = Depends(get_session)
-):
+@app.get("/api/events/actions", responses={200: {"model": List[SecurityEventResponse]}})
+async def get_actions(request: Request, limit: int = 50):
     """Get on-chain actions taken by agent"""
-    query = (
-        select(SecurityEvent)
-        .where(SecurityEvent.event_type.in_(["ACTION", "PROACTIVE_DEFENSE", "AMM_PAUSED"]))
-        .order_by(desc(SecurityEvent.timestamp))
-        .limit(limit)
+    return await event_list_response(
+        request, f"actions:{limit}", EVENTS_QUERY.limit(limit), ACTION_FILTERS, dict
     )
-    
-    result = await session.execute(query)
-    events = result.scalars().all()
-    
-    return [SecurityEventResponse(**e.to_dict()) for e in events]
 
 
-@app.get("/api/stats", response_model=DashboardStats)
-async def get_stats(session: AsyncSession = Depends(get_session)):
-    """Get dashboard statistics"""
-    # Total events
-    total_result = await session.execute(select(func.count(SecurityEvent.id)))
-    total_events = total_result.scalar() or 0
-    
-    # Threats detected
-    threats_result = await session.execute(
-        select(func.count(SecurityEvent.id))
-        .where(SecurityEvent.classification.isnot(None))
-        .where(SecurityEvent.classification != "NATURAL")
-    )
-    threats_detected = threats_result.scalar() or 0
-    
-    # Actions taken
-    actions_result = await session.execute(
-        select(func.count(SecurityEvent.id))
-        .where(SecurityEvent.event_type == "ACTION")
-    )
-    actions_taken = actions_result.scalar() or 0
+def _build_stats_query():
+    # Total events, threats detected and actions taken in one aggregate
+    counts = select(
+        func.count(SecurityEvent.id).label("total_events"),
+        func.count(SecurityEvent.id).filter(
+            and_(
+                SecurityEvent.classification.isnot(None),
+                SecurityEvent.classification != "NATURAL"
+            )
+        ).label("threats_detected"),
+        func.count(SecurityEvent.id).filter(SecurityEvent.event_type == "ACTION").label("actions_taken")
+    ).subquery()
     
     # Latest observation for current state
-    latest_result = await session.execute(
-        select(SecurityEvent)
+    latest = (
+        select(
+            SecurityEvent.oracle_price,
+            SecurityEvent.amm_price,
+            SecurityEvent.price_deviation,
+            SecurityEvent.timestamp
+        )
         .where(SecurityEvent.event_type == "OBSERVATION")
         .order_by(desc(SecurityEvent.timestamp))
         .limit(1)
+        .subquery()
     )
-    latest = latest_result.scalar()
-    
-    # Get actual blockchain state
-    amm_paused, vault_paused, liquidations_blocked = get_blockchain_state()
-    
-    if latest:
-        return DashboardStats(
-            total_events=total_events,
-            threats_detected=threats_detected,
-            actions_taken=actions_taken,
-            current_oracle_price=latest.oracle_price,
-            current_amm_price=latest.amm_price,
-            price_deviation=latest.price_deviation,
-            amm_paused=amm_paused,
-            vault_paused=vault_paused,
-            liquidations_blocked=liquidations_blocked,
-            last_update=latest.timestamp.isoformat() if latest.timestamp else ""
+    
+    # Both in one round-trip; LEFT JOIN keeps the counts when there's no observation yet
+    return select(counts, latest).select_from(counts.outerjoin(latest, true()))
+
+
+STATS_QUERY = _build_stats_query()
+
+
+async def compute_stats() -> Dict[str, Any]:
+    """Compute dashboard statistics from the database and chain"""
+    # The DB query and the actual blockchain state are independent
+    async with async_session_factory() as session:
+        stats_result, (amm_paused, vault_paused, liquidations_blocked) = await asyncio.gather(
+            session.execute(STATS_QUERY),
+            get_blockchain_state()
         )
+    row = stats_result.one()
+    
+    stats = {
+        "total_events": row.total_events,
+        "threats_detected": row.threats_detected,
+        "actions_taken": row.actions_taken,
+        "current_oracle_price": 0,
+        "current_amm_price": 0,
+        "price_deviation": 0,
+        "amm_paused": amm_paused,
+        "vault_paused": vault_paused,
+        "liquidations_blocked": liquidations_blocked,
+        "last_update": ""
+    }
+    
+    if row.timestamp is not None:
+        stats.update(
+            current_oracle_price=row.oracle_price,
+            current_amm_price=row.amm_price,
+            price_deviation=row.price_deviation,
+            last_update=row.timestamp
+        )
+    
+    return stats
+
+
+async def current_stats() -> Dict[str, Any]:
+    """Dashboard statistics, shared with other callers for RESPONSE_CACHE_TTL"""
+    stats = get_cached_response("stats")
+    if stats is None:
+        stats = await compute_stats()
+        set_cached_response("stats", stats)
+    return stats
+
+
+@app.get("/api/stats", responses={200: {"model": DashboardStats}})
+async def get_stats(request: Request):
+    """
+    Get dashboard statistics
+    Fallback for clients without a WebSocket; live updates are pushed over /ws
+    """
+    stats = await current_stats()
+    etag = make_etag(*stats.values())
+    headers = cache_headers(etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return ORJSONResponse(stats, headers=headers)
+
+
+# Charts only need a few hundred points; longer windows are downsampled
+PRICE_HISTORY_MAX_POINTS = 500
+
+
+def downsample_lttb(rows: List[Tuple], n_out: int) -> List[Tuple]:
+    """
+    Largest-Triangle-Three-Buckets downsampling of
+    (timestamp, oracle_price, amm_price, block_number) rows
+    Keeps the endpoints and, per bucket, the row whose triangle with its
+    neighbours is largest (summed over both price series), so spikes survive
+    """
+    n = len(rows)
+    if n_out < 3 or n <= n_out:
+        return rows
     
-    return DashboardStats(
-        total_events=total_events,
-        threats_detected=threats_detected,
-        actions_taken=actions_taken,
-        current_oracle_price=0,
-        current_amm_price=0,
-        price_deviation=0,
-        amm_paused=amm_paused,
-        vault_paused=vault_paused,
-        liquidations_blocked=liquidations_blocked,
-        last_update=""
+    xs = [row[0].timestamp() for row in rows]
+    oracle = [row[1] or 0.0 for row in rows]
+    amm = [row[2] or 0.0 for row in rows]
+    
+    sampled = [rows[0]]
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        
+        # Third vertex: the average of the next bucket (the last row at the end)
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        count = next_end - end
+        avg_x = sum(xs[end:next_end]) / count
+        avg_oracle = sum(oracle[end:next_end]) / count
+        avg_amm = sum(amm[end:next_end]) / count
+        
+        ax, a_oracle, a_amm = xs[a], oracle[a], amm[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = (
+                abs((ax - avg_x) * (oracle[j] - a_oracle) - (ax - xs[j]) * (avg_oracle - a_oracle))
+                + abs((ax - avg_x) * (amm[j] - a_amm) - (ax - xs[j]) * (avg_amm - a_amm))
+            )
+            if area > best_area:
+                best, best_area = j, area
+        
+        sampled.append(rows[best])
+        a = best
+    
+    sampled.append(rows[-1])
+    return sampled
+
+
+PRICE_WINDOW_QUERY = (
+    select(func.max(SecurityEvent.timestamp), func.count(SecurityEvent.id))
+    .where(SecurityEvent.event_type == "OBSERVATION")
+    .where(SecurityEvent.timestamp >= bindparam("since"))
+)
+
+PRICE_HISTORY_QUERY = (
+    select(
+        SecurityEvent.timestamp,
+        SecurityEvent.oracle_price,
+        SecurityEvent.amm_price,
+        SecurityEvent.block_number
     )
+    .where(SecurityEvent.event_type == "OBSERVATION")
+    .where(SecurityEvent.timestamp >= bindparam("since"))
+    .order_by(SecurityEvent.timestamp)
+)
 
 
-@app.get("/api/prices", response_model=List[PriceDataPoint])
+@app.get("/api/prices", responses={200: {"model": List[PriceDataPoint]}})
 async def get_price_history(
+    request: Request,
     hours: int = 1,
-    session: AsyncSession = Depends(get_session)
+    max_points: int = PRICE_HISTORY_MAX_POINTS
 ):
-    """Get price history for charting"""
-    since = datetime.utcnow() - timedelta(hours=hours)
+    """Get price history for charting, downsampled to at most max_points"""
+    async with async_session_factory() as session:
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        
+        # Cheap preflight: skip the full query if the client's copy is current
+        window_result = await session.execute(PRICE_WINDOW_QUERY, {"since": since})
+        latest_ts, point_count = window_result.one()
+        
+        etag = make_etag(hours, max_points, latest_ts, point_count)
+        headers = cache_headers(etag)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        
+        result = await session.execute(PRICE_HISTORY_QUERY, {"since": since})
+        rows = downsample_lttb(result.all(), max_points)
+        
+        return ORJSONResponse([
+            {
+                "timestamp": ts or "",
+                "oracle_price": oracle_price,
+                "amm_price": amm_price,
+                "block_number": block_number
+            }
+            for ts, oracle_price, amm_price, block_number in rows
+        ], headers=headers)
+
+
+# =============================================================================
+# ADMIN ENDPOINTS (Simulate Attack / Reset AMM)
+# =============================================================================
+
+CONTRACTS_DIR = os.path.join(os.path.dirname(__file__), "..", "contracts")
+
+
+async def run_hardhat_script(script: str, timeout: float) -> Tuple[int, str]:
+    """
+    Run a Hardhat script on Sepolia without blocking the event loop
     
-    query = (
-        select(SecurityEvent)
-        .where(SecurityEvent.event_type == "OBSERVATION")
-        .where(SecurityEvent.timestamp >= since)
-        .order_by(SecurityEvent.timestamp)
+    Returns (returncode, combined stdout/stderr).
+    Raises asyncio.TimeoutError after killing the process.
+    """
+    proc = await asyncio.create_subprocess_shell(
+        f"npx hardhat run {script} --network sepolia",
+        cwd=CONTRACTS_DIR,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
     )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
     
-    result = await session.execute(query)
-    events = result.scalars().all()
+    # Replace undecodable chars instead of crashing
+    return proc.returncode, (stdout or b"").decode("utf-8", errors="replace")
+
+
+# Attack/reset scripts wait on several Sepolia blocks, so they run as
+# background jobs: the request returns a job id at once, clients poll
+# /api/admin/job/{id} and WebSocket clients get an "admin_job" message
+ADMIN_JOB_RETENTION = 50
+admin_jobs: Dict[str, Dict[str, Any]] = {}
+_admin_job_tasks: set = set()
+
+
+async def _run_admin_job(job: Dict[str, Any], work):
+    try:
+        job["result"] = await work
+        job["status"] = "done"
+    except Exception as e:
+        job["result"] = {"success": False, "message": str(e)}
+        job["status"] = "failed"
+    await manager.broadcast({"type": "admin_job", "data": job})
+
+
+def start_admin_job(job_type: str, work) -> Dict[str, Any]:
+    """Run an admin coroutine in the background and return its job record"""
+    # Forget the oldest finished jobs (dicts keep insertion order)
+    for old_id in [k for k, v in admin_jobs.items() if v["status"] != "pending"]:
+        if len(admin_jobs) < ADMIN_JOB_RETENTION:
+            break
+        del admin_jobs[old_id]
     
-    return [
-        PriceDataPoint(
-            timestamp=e.timestamp.isoformat() if e.timestamp else "",
-            oracle_price=e.oracle_price,
-            amm_price=e.amm_price,
-            block_number=e.block_number
-        )
-        for e in events
-    ]
+    job = {"job_id": uuid.uuid4().hex, "type": job_type, "status": "pending", "result": None}
+    admin_jobs[job["job_id"]] = job
+    
+    task = asyncio.create_task(_run_admin_job(job, work))
+    _admin_job_tasks.add(task)
+    task.add_done_callback(_admin_job_tasks.discard)
+    return job
+
+
+@app.get("/api/admin/job/{job_id}")
+async def get_admin_job(job_id: str):
+    """Get the status and, once finished, the result of an admin job"""
+    job = admin_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+# Dry-run attack: the same 50 WETH swap attack-with-defense.js makes, run as
+# an eth_call with the sender's WETH balance and allowance injected through
+# state overrides, so nothing is mined and no gas is spent
+ATTACK_AMOUNT = 50 * 10**18
+DRY_RUN_SENDER = "0x000000000000000000000000000000000000dEaD"
+SWAP_WETH_FOR_USDC_SELECTOR = bytes(Web3.keccak(text="swapWethForUsdc(uint256)")[:4])
+GET_RESERVES_CALLDATA = bytes(Web3.keccak(text="getReserves()")[:4])
+# OpenZeppelin ERC20 storage layout: _balances is slot 0, _allowances slot 1
+ERC20_BALANCES_SLOT = 0
+ERC20_ALLOWANCES_SLOT = 1
+
+
+def _build_dry_run_attack():
+    """(AMM address, swap call, state override) for the dry-run attack, or None"""
+    try:
+        amm_address = Web3.to_checksum_address(CONTRACT_ADDRESSES["AMM"])
+        weth_address = Web3.to_checksum_address(CONTRACT_ADDRESSES["WETH"])
+    except (KeyError, ValueError):
+        return None
+    
+    balance_slot = Web3.keccak(abi_encode(["address", "uint256"], [DRY_RUN_SENDER, ERC20_BALANCES_SLOT]))
+    allowance_slot = Web3.keccak(abi_encode(
+        ["address", "bytes32"],
+        [amm_address, Web3.keccak(abi_encode(["address", "uint256"], [DRY_RUN_SENDER, ERC20_ALLOWANCES_SLOT]))]
+    ))
+    amount = Web3.to_hex(ATTACK_AMOUNT.to_bytes(32, "big"))
+    
+    swap_call = {
+        "from": DRY_RUN_SENDER,
+        "to": amm_address,
+        "data": SWAP_WETH_FOR_USDC_SELECTOR + abi_encode(["uint256"], [ATTACK_AMOUNT])
+    }
+    state_override = {
+        weth_address: {"stateDiff": {Web3.to_hex(balance_slot): amount, Web3.to_hex(allowance_slot): amount}}
+    }
+    return amm_address, swap_call, state_override
 
 
-# =============================================================================
-# ADMIN ENDPOINTS (Simulate Attack / Reset AMM)
-# =============================================================================
+_DRY_RUN_ATTACK = _build_dry_run_attack()
+
+
+async def dry_run_attack() -> Dict[str, Any]:
+    """Simulate the attack swap with eth_call and report the price impact"""
+    if _DRY_RUN_ATTACK is None:
+        return {"success": False, "blocked": False, "dry_run": True, "message": "AMM/WETH address not configured"}
+    
+    amm_address, swap_call, state_override = _DRY_RUN_ATTACK
+    try:
+        # Reserves and the swap are independent reads; one round of RPCs
+        reserves_data, swap_data = await asyncio.gather(
+            w3.eth.call({"to": amm_address, "data": GET_RESERVES_CALLDATA}, "latest"),
+            w3.eth.call(swap_call, "latest", state_override)
+        )
+    except ContractLogicError as e:
+        if "paused" in str(e).lower():
+            return {
+                "success": True,
+                "blocked": True,
+                "dry_run": True,
+                "message": "🛡️ Dry run: the swap would revert - AMM is paused"
+            }
+        return {"success": False, "blocked": False, "dry_run": True, "message": str(e)}
+    except Exception as e:
+        return {"success": False, "blocked": False, "dry_run": True, "message": str(e)}
+    
+    weth_reserve, usdc_reserve, _ = abi_decode(["uint256", "uint256", "uint256"], reserves_data)
+    (usdc_out,) = abi_decode(["uint256"], swap_data)
+    
+    # USDC has 6 decimals, WETH 18; the swap fee stays in the WETH reserve
+    price_before = (usdc_reserve / 1e6) / (weth_reserve / 1e18)
+    price_after = ((usdc_reserve - usdc_out) / 1e6) / ((weth_reserve + ATTACK_AMOUNT) / 1e18)
+    
+    return {
+        "success": True,
+        "blocked": False,
+        "dry_run": True,
+        "message": f"🧪 Dry run: a 50 WETH swap would move the AMM price from ${price_before:.2f} to ${price_after:.2f}",
+        "price_before": price_before,
+        "price_after": price_after
+    }
+
 
 @app.post("/api/admin/simulate-attack")
-async def simulate_attack():
+async def simulate_attack(dry_run: bool = False):
     """
     Simulate a flash loan attack on the AMM
     The AMEN agent should detect and block this
+    Runs in the background; returns a job id to poll
+    With ?dry_run=true, simulates the swap via eth_call and returns at once
     """
-    import subprocess
-    
+    if dry_run:
+        return await dry_run_attack()
+    return start_admin_job("simulate-attack", _simulate_attack())
+
+
+async def _simulate_attack() -> Dict[str, Any]:
     try:
-        contracts_dir = os.path.join(os.path.dirname(__file__), "..", "contracts")
-        
         # Use the attack-with-defense script that shows blocking
-        result = subprocess.run(
-            "npx hardhat run scripts/attack-with-defense.js --network sepolia",
-            cwd=contracts_dir,
-            capture_output=True,
-            timeout=120,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'  # Replace undecodable chars instead of crashing
-        )
-        
-        # Handle None values
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        output = stdout + stderr
+        _, output = await run_hardhat_script("scripts/attack-with-defense.js", timeout=120)
         
         # Check if attack was blocked
         if "BLOCKED" in output.upper() or "PAUSED" in output.upper() or "DEFENSE" in output.upper():
@@ -523,39 +1167,29 @@ async def simulate_attack():
                 "message": "Attack simulation completed",
                 "output": output[-1000:] if len(output) > 1000 else output
             }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {"success": False, "blocked": False, "message": "Attack timed out (120s)"}
     except Exception as e:
         return {"success": False, "blocked": False, "message": str(e)}
+    finally:
+        refresh_chain_views()
 
 
 @app.post("/api/admin/reset-amm")
 async def reset_amm():
     """
     Reset the AMM to $2000 price (Fast version - rebalances existing AMM)
+    Runs in the background; returns a job id to poll
     """
-    import subprocess
-    
+    return start_admin_job("reset-amm", _reset_amm())
+
+
+async def _reset_amm() -> Dict[str, Any]:
     try:
-        contracts_dir = os.path.join(os.path.dirname(__file__), "..", "contracts")
-        
         # Use fast reset script - much quicker than redeploying
-        result = subprocess.run(
-            "npx hardhat run scripts/fast-reset-amm.js --network sepolia",
-            cwd=contracts_dir,
-            capture_output=True,
-            timeout=90,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
+        returncode, output = await run_hardhat_script("scripts/fast-reset-amm.js", timeout=90)
         
-        # Handle None values
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        output = stdout + stderr
-        
-        if "Reset" in output or "2000" in output or result.returncode == 0:
+        if "Reset" in output or "2000" in output or returncode == 0:
             return {
                 "success": True,
                 "message": "✅ AMM reset to $2000!",
@@ -568,10 +1202,12 @@ async def reset_amm():
                 "message": f"Reset issue: {output[-200:]}",
                 "output": output
             }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {"success": False, "message": "Reset timed out (90s)"}
     except Exception as e:
         return {"success": False, "message": str(e)}
+    finally:
+        refresh_chain_views()
 
 
 @app.post("/api/admin/restore-price")
@@ -580,25 +1216,11 @@ async def restore_price():
     AUTO-RESTORE: Agent calls this to restore AMM price after attack detection
     Executes counter-swap to neutralize the manipulation
     """
-    import subprocess
-    
     try:
         print("🔄 Agent requesting automatic price restoration...")
-        contracts_dir = os.path.join(os.path.dirname(__file__), "..", "contracts")
         
-        result = subprocess.run(
-            "npx hardhat run scripts/agent-restore-price.js --network sepolia",
-            cwd=contracts_dir,
-            capture_output=True,
-            timeout=180,  # 3 min timeout for blockchain txs
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        output = stdout + stderr
+        # 3 min timeout for blockchain txs
+        _, output = await run_hardhat_script("scripts/agent-restore-price.js", timeout=180)
         
         print(f"Restore output:\n{output}")
         
@@ -609,7 +1231,7 @@ async def restore_price():
             "message": "✅ Price automatically restored!" if success else "⚠️ Restoration attempted",
             "output": output[-800:] if len(output) > 800 else output
         }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {"success": False, "message": "⏱️ Restoration timed out"}
     except Exception as e:
         print(f"Restore error: {e}")
@@ -630,24 +1252,8 @@ async def unpause_protocol():
     Unpause all protocol components (AMM, Vault, Liquidations)
     Used to reset after attack blocking for new tests
     """
-    import subprocess
-    
     try:
-        contracts_dir = os.path.join(os.path.dirname(__file__), "..", "contracts")
-        
-        result = subprocess.run(
-            "npx hardhat run scripts/unpause-all.js --network sepolia",
-            cwd=contracts_dir,
-            capture_output=True,
-            timeout=90,
-            shell=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        
-        stdout = result.stdout or ""
-        stderr = result.stderr or ""
-        output = stdout + stderr
+        _, output = await run_hardhat_script("scripts/unpause-all.js", timeout=90)
         
         if "NORMAL" in output or "unpaused" in output.lower():
             return {
@@ -661,10 +1267,12 @@ async def unpause_protocol():
                 "message": "Reset completed",
                 "output": output[-500:] if len(output) > 500 else output
             }
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {"success": False, "message": "Unpause timed out (90s)"}
     except Exception as e:
         return {"success": False, "message": str(e)}
+    finally:
+        refresh_chain_views()
 
 
 # =============================================================================
@@ -675,15 +1283,19 @@ async def unpause_protocol():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await manager.connect(websocket)
+    await manager.send(websocket, {"type": "stats", "data": await current_stats()})
     try:
         while True:
             # Keep connection alive
             data = await websocket.receive_text()
-            # Echo back for ping/pong
+            # Echo back for ping/pong (through the queue: the writer task owns sends)
             if data == "ping":
-                await websocket.send_text("pong")
-    except WebSocketDisconnect:
-        manager.disconnect(websocket)
+                await manager.send_raw(websocket, "pong")
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: receive after the writer closed a dropped client
+        pass
+    finally:
+        await manager.disconnect(websocket)
 
 
 # =============================================================================
@@ -695,10 +1307,20 @@ if __name__ == "__main__":
     
     port = int(os.getenv("PORT", "8080"))
     host = os.getenv("HOST", "0.0.0.0")
+    # Auto-reload is a dev-only convenience and can't be combined with workers
+    reload = os.getenv("RELOAD", "false").lower() == "true"
+    # Live stats and WebSocket broadcasts are per-process, so extra workers
+    # only help deployments that don't rely on /ws push
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
-        reload=True
+        reload=reload,
+        workers=None if reload else workers,
+        # uvicorn[standard] provides uvloop/httptools; "auto" picks them up
+        # where available and falls back to asyncio on Windows
+        loop="auto",
+        http="auto"
     )
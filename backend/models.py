@@ -3,15 +3,101 @@ AMEN Backend - Database Models
 SQLAlchemy models for security event storage
 """
 
-from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, Text, JSON
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Tuple
+from uuid import uuid4
+
+import orjson
+from sqlalchemy import (
+    create_engine, event, inspect, Column, Index, Integer, String, Float, Boolean, DateTime, Text, JSON, LargeBinary,
+    MetaData, PrimaryKeyConstraint, TypeDecorator, text, select, insert, func
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB, ExcludeConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+class ModelBase:
+    """Shared helpers for all models"""
+    
+    # Columns exposed by to_dict (and selected by the API's list queries), in order
+    dict_columns: Tuple[str, ...] = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.dict_columns}
+        if data.get("timestamp") is not None:
+            data["timestamp"] = data["timestamp"].isoformat()
+        return data
+    
+    @classmethod
+    async def create_many(cls, session: AsyncSession, rows: List[Dict[str, Any]]) -> list:
+        """
+        Insert rows with one INSERT ... RETURNING executemany (no refresh round-trip)
+        Returns the inserted instances, with ids and server defaults, in input order
+        """
+        if not rows:
+            return []
+        result = await session.execute(
+            insert(cls).returning(cls, sort_by_parameter_order=True), rows
+        )
+        return list(result.scalars())
+
+
+Base = declarative_base(cls=ModelBase)
+
+# JSONB on PostgreSQL (pre-parsed, indexable), plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone-aware UTC timestamp
+    TIMESTAMPTZ on PostgreSQL. SQLite has no zone support, so values are stored
+    as naive UTC and tagged UTC again on the way out. Naive inputs are taken as UTC.
+    """
+    impl = DateTime(timezone=True)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+        if dialect.name != "postgresql":
+            value = value.replace(tzinfo=None)
+        return value
+    
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
 
-Base = declarative_base()
+# A well-formed transaction hash: 0x + 32 bytes of hex
+TX_HASH_PATTERN = re.compile(r"^0x[0-9a-fA-F]{64}$")
+
+
+class TxHash(TypeDecorator):
+    """
+    32-byte transaction hash
+    Stored as raw bytes (BYTEA / BLOB) rather than 66 characters of hex;
+    the application still reads and writes "0x"-prefixed hex strings.
+    """
+    impl = LargeBinary(32)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            # str: a row written before the column became binary (SQLite)
+            return value
+        return "0x" + value.hex()
 
 
 class SecurityEvent(Base):
@@ -22,9 +108,9 @@ class SecurityEvent(Base):
     __tablename__ = "security_events"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(UTCDateTime, server_default=func.now(), index=True)
     block_number = Column(Integer, index=True)
-    event_type = Column(String(50), index=True)  # OBSERVATION, ASSESSMENT, DECISION, ACTION
+    event_type = Column(String(50))  # OBSERVATION, ASSESSMENT, DECISION, ACTION
     
     # Market data
     oracle_price = Column(Float)
@@ -32,10 +118,10 @@ class SecurityEvent(Base):
     price_deviation = Column(Float)
     
     # Assessment data
-    classification = Column(String(50), nullable=True, index=True)
+    classification = Column(String(50), nullable=True)
     confidence = Column(Float, nullable=True)
     explanation = Column(Text, nullable=True)
-    evidence = Column(JSON, nullable=True)
+    evidence = Column(JSONVariant, nullable=True)
     
     # Decision data
     action = Column(String(50), nullable=True, index=True)
@@ -43,26 +129,88 @@ class SecurityEvent(Base):
     execute_on_chain = Column(Boolean, nullable=True)
     
     # Execution data
-    tx_hash = Column(String(66), nullable=True, index=True)
-    
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "block_number": self.block_number,
-            "event_type": self.event_type,
-            "oracle_price": self.oracle_price,
-            "amm_price": self.amm_price,
-            "price_deviation": self.price_deviation,
-            "classification": self.classification,
-            "confidence": self.confidence,
-            "explanation": self.explanation,
-            "evidence": self.evidence,
-            "action": self.action,
-            "action_reason": self.action_reason,
-            "execute_on_chain": self.execute_on_chain,
-            "tx_hash": self.tx_hash
-        }
+    tx_hash = Column(TxHash, nullable=True, index=True)
+    
+    # List endpoints filter on event_type/classification and sort newest first;
+    # the composite indexes also serve plain lookups on either column.
+    # The partial indexes cover only the rows the threat timeline and the
+    # price/stats lookups read, so they stay small as history grows.
+    __table_args__ = (
+        Index("ix_events_type_ts", event_type, timestamp.desc()),
+        Index("ix_events_class_ts", classification, timestamp.desc()),
+        Index(
+            "ix_events_threats_ts", timestamp.desc(),
+            postgresql_where=text("classification IS NOT NULL AND classification != 'NATURAL'"),
+            sqlite_where=text("classification IS NOT NULL AND classification != 'NATURAL'")
+        ),
+        Index(
+            "ix_events_obs_ts", timestamp.desc(),
+            postgresql_where=text("event_type = 'OBSERVATION'"),
+            sqlite_where=text("event_type = 'OBSERVATION'")
+        ),
+        # Serves evidence @> '[...]' containment lookups; jsonb_path_ops is
+        # several times smaller than the default GIN opclass
+        Index(
+            "ix_events_evidence_gin", evidence,
+            postgresql_using="gin",
+            postgresql_ops={"evidence": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+        # Rows arrive in time order, so a BRIN index prunes time-range scans
+        # for a few KB. The B-tree on timestamp stays: the feed's ORDER BY
+        # timestamp DESC LIMIT n needs an ordered index.
+        Index(
+            "ix_events_ts_brin", timestamp, block_number,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ).ddl_if(dialect="postgresql"),
+    )
+    
+    dict_columns = (
+        "id",
+        "timestamp",
+        "block_number",
+        "event_type",
+        "oracle_price",
+        "amm_price",
+        "price_deviation",
+        "classification",
+        "confidence",
+        "explanation",
+        "evidence",
+        "action",
+        "action_reason",
+        "execute_on_chain",
+        "tx_hash"
+    )
+
+
+# Classifications that don't count as threats
+NON_THREAT_CLASSIFICATIONS = (None, "NATURAL")
+
+
+class ThreatTimeline(Base):
+    """
+    Threat timeline entry
+    Copy of each non-NATURAL security event, written alongside it, so the
+    threat feed reads a small table instead of filtering all events
+    """
+    __tablename__ = "threat_timeline"
+    
+    # Same id as the source SecurityEvent
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    timestamp = Column(UTCDateTime)
+    classification = Column(String(50))
+    confidence = Column(Float, nullable=True)
+    action = Column(String(50), nullable=True)
+    tx_hash = Column(TxHash, nullable=True)
+    explanation = Column(Text, nullable=True)
+    
+    __table_args__ = (
+        Index("ix_threats_ts", timestamp.desc()),
+    )
+
+
+THREAT_TIMELINE_COLUMNS = ("id", "timestamp", "classification", "confidence", "action", "tx_hash", "explanation")
 
 
 class MarketSnapshot(Base):
@@ -73,7 +221,7 @@ class MarketSnapshot(Base):
     __tablename__ = "market_snapshots"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(UTCDateTime, server_default=func.now())
     block_number = Column(Integer, index=True)
     
     # Prices
@@ -91,21 +239,31 @@ class MarketSnapshot(Base):
     vault_paused = Column(Boolean, default=False)
     liquidations_blocked = Column(Boolean, default=False)
     
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "block_number": self.block_number,
-            "oracle_price": self.oracle_price,
-            "amm_price": self.amm_price,
-            "oracle_twap": self.oracle_twap,
-            "weth_reserve": self.weth_reserve,
-            "usdc_reserve": self.usdc_reserve,
-            "total_collateral": self.total_collateral,
-            "total_loans": self.total_loans,
-            "vault_paused": self.vault_paused,
-            "liquidations_blocked": self.liquidations_blocked
-        }
+    # Append-only and only ever read by time range: BRIN on PostgreSQL, a
+    # plain B-tree on SQLite
+    __table_args__ = (
+        Index(
+            "ix_snapshots_ts_brin", timestamp, block_number,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ).ddl_if(dialect="postgresql"),
+        Index("ix_snapshots_ts", timestamp).ddl_if(dialect="sqlite"),
+    )
+    
+    dict_columns = (
+        "id",
+        "timestamp",
+        "block_number",
+        "oracle_price",
+        "amm_price",
+        "oracle_twap",
+        "weth_reserve",
+        "usdc_reserve",
+        "total_collateral",
+        "total_loans",
+        "vault_paused",
+        "liquidations_blocked"
+    )
 
 
 class AgentAction(Base):
@@ -115,11 +273,11 @@ class AgentAction(Base):
     __tablename__ = "agent_actions"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(UTCDateTime, server_default=func.now(), index=True)
     block_number = Column(Integer)
     
     action_type = Column(String(50))  # PAUSE_PROTOCOL, BLOCK_LIQUIDATIONS, FLAG_ORACLE
-    tx_hash = Column(String(66), unique=True)
+    tx_hash = Column(TxHash)
     
     # Trigger info
     trigger_classification = Column(String(50))
@@ -130,50 +288,406 @@ class AgentAction(Base):
     success = Column(Boolean)
     gas_used = Column(Integer, nullable=True)
     
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
-            "block_number": self.block_number,
-            "action_type": self.action_type,
-            "tx_hash": self.tx_hash,
-            "trigger_classification": self.trigger_classification,
-            "trigger_confidence": self.trigger_confidence,
-            "trigger_reason": self.trigger_reason,
-            "success": self.success,
-            "gas_used": self.gas_used
-        }
+    # tx_hash is only ever looked up by equality. On PostgreSQL uniqueness is
+    # enforced through a hash index (EXCLUDE USING hash), which is smaller than
+    # a B-tree and probes in one step; SQLite keeps a unique B-tree.
+    __table_args__ = (
+        ExcludeConstraint(
+            (tx_hash, "="), name="ex_agent_actions_tx_hash", using="hash"
+        ).ddl_if(dialect="postgresql"),
+        Index("ix_agent_actions_tx_hash", tx_hash, unique=True).ddl_if(dialect="sqlite"),
+    )
+    
+    dict_columns = (
+        "id",
+        "timestamp",
+        "block_number",
+        "action_type",
+        "tx_hash",
+        "trigger_classification",
+        "trigger_confidence",
+        "trigger_reason",
+        "success",
+        "gas_used"
+    )
+
+
+# JSON/JSONB columns (evidence) are encoded and decoded with orjson instead of stdlib json
+JSON_ENGINE_KWARGS = {
+    "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+    "json_deserializer": orjson.loads,
+}
+
+
+# Per-connection settings for the SQLite dev database: WAL lets dashboard reads
+# run alongside the agent's writes, and synchronous=NORMAL is safe under WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
 # Database setup
 def get_database_url(use_async: bool = True) -> str:
     """Get database URL from environment or default"""
-    import os
     db_url = os.getenv("DATABASE_URL", "sqlite:///./amen_security.db")
     
     if use_async and db_url.startswith("sqlite:"):
         # Convert to async SQLite URL
         db_url = db_url.replace("sqlite:", "sqlite+aiosqlite:")
+    elif use_async and db_url.startswith("postgresql://"):
+        # Convert to async PostgreSQL URL
+        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
     
     return db_url
 
 
+# Append-only time-series tables that can be range-partitioned by month
+PARTITIONED_TABLES = ("security_events", "market_snapshots")
+PARTITION_SUFFIX = re.compile(r"_(\d{4})_(\d{2})$")
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def _is_partitioned(conn, table_name: str) -> bool:
+    return bool(conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = :name"
+    ), {"name": table_name}).scalar())
+
+
+def create_partitioned_tables(engine):
+    """
+    Create the time-series tables as PARTITION BY RANGE (timestamp) (PostgreSQL)
+    Only tables that don't exist yet are created; existing ones are left as is
+    """
+    inspector = inspect(engine)
+    metadata = MetaData()
+    
+    for name in PARTITIONED_TABLES:
+        if inspector.has_table(name):
+            continue
+        
+        table = Base.metadata.tables[name].to_metadata(metadata)
+        # PostgreSQL requires the partition key in the primary key
+        table.c.timestamp.primary_key = True
+        table.append_constraint(PrimaryKeyConstraint(table.c.id, table.c.timestamp))
+        table.dialect_options["postgresql"]["partition_by"] = "RANGE (timestamp)"
+        table.create(engine)
+        
+        with engine.begin() as conn:
+            # Catch-all so inserts never fail if a month wasn't created in time
+            conn.execute(text(f'CREATE TABLE IF NOT EXISTS "{name}_default" PARTITION OF "{name}" DEFAULT'))
+
+
+def _child_partitions(conn, table_name: str) -> List[str]:
+    return conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = :name"
+    ), {"name": table_name}).scalars().all()
+
+
+def _create_month_partition(conn, name: str, start: date, has_default: bool):
+    """Create one monthly partition, first moving its rows out of the DEFAULT partition"""
+    end = _month_start(start, 1)
+    partition = f"{name}_{start:%Y_%m}"
+    default = f"{name}_default"
+    # Month bounds are UTC, matching the timestamptz column
+    lower, upper = f"'{start} 00:00:00+00'", f"'{end} 00:00:00+00'"
+    in_range = f"timestamp >= {lower} AND timestamp < {upper}"
+    create = f'CREATE TABLE "{partition}" PARTITION OF "{name}" FOR VALUES FROM ({lower}) TO ({upper})'
+    
+    if not has_default or not conn.execute(text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_range})')).scalar():
+        conn.execute(text(create))
+        return
+    
+    # PostgreSQL won't add a partition whose range already has rows in DEFAULT:
+    # detach DEFAULT, add the partition, move the rows over and re-attach
+    conn.execute(text(f'ALTER TABLE "{name}" DETACH PARTITION "{default}"'))
+    conn.execute(text(create))
+    conn.execute(text(f'INSERT INTO "{partition}" SELECT * FROM "{default}" WHERE {in_range}'))
+    conn.execute(text(f'DELETE FROM "{default}" WHERE {in_range}'))
+    conn.execute(text(f'ALTER TABLE "{name}" ATTACH PARTITION "{default}" DEFAULT'))
+
+
+def ensure_partitions(engine, months_ahead: int = 2):
+    """
+    Create monthly partitions from the current month through months_ahead,
+    plus any month whose rows fell into DEFAULT because it had no partition yet
+    """
+    this_month = _month_start(datetime.now(timezone.utc).date())
+    
+    with engine.begin() as conn:
+        for name in PARTITIONED_TABLES:
+            if not _is_partitioned(conn, name):
+                continue
+            
+            existing = set(_child_partitions(conn, name))
+            has_default = f"{name}_default" in existing
+            
+            months = {_month_start(this_month, offset) for offset in range(months_ahead + 1)}
+            if has_default:
+                months.update(conn.execute(text(
+                    "SELECT DISTINCT date_trunc('month', timestamp AT TIME ZONE 'UTC')::date "
+                    f'FROM "{name}_default"'
+                )).scalars())
+            
+            for start in sorted(months):
+                if f"{name}_{start:%Y_%m}" not in existing:
+                    _create_month_partition(conn, name, start, has_default)
+
+
+def drop_old_partitions(engine, retention_days: int):
+    """Drop monthly partitions whose whole range is older than retention_days"""
+    cutoff = datetime.now(timezone.utc).date() - timedelta(days=retention_days)
+    
+    with engine.begin() as conn:
+        for name in PARTITIONED_TABLES:
+            for child in _child_partitions(conn, name):
+                match = PARTITION_SUFFIX.search(child)
+                if not match:
+                    continue
+                end = _month_start(date(int(match.group(1)), int(match.group(2)), 1), 1)
+                if end <= cutoff:
+                    conn.execute(text(f'DROP TABLE IF EXISTS "{child}"'))
+
+
+def maintain_partitions(engine):
+    """Create upcoming monthly partitions and apply DB_RETENTION_DAYS (PostgreSQL)"""
+    if engine.dialect.name != "postgresql":
+        return
+    ensure_partitions(engine)
+    retention_days = os.getenv("DB_RETENTION_DAYS")
+    if retention_days:
+        drop_old_partitions(engine, int(retention_days))
+
+
 def create_tables():
     """Create all database tables (sync)"""
     db_url = get_database_url(use_async=False)
-    engine = create_engine(db_url)
+    engine = create_engine(db_url, **JSON_ENGINE_KWARGS)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    
+    partitioned = (
+        engine.dialect.name == "postgresql"
+        and os.getenv("DB_PARTITIONED", "").lower() in ("1", "true", "yes")
+    )
+    if partitioned:
+        create_partitioned_tables(engine)
+    
+    # The threat timeline is backfilled below only when this run creates it
+    new_threat_timeline = not inspect(engine).has_table(ThreatTimeline.__tablename__)
+    
     Base.metadata.create_all(engine)
+    
+    if engine.dialect.name == "postgresql":
+        inspector = inspect(engine)
+        
+        # Tables created before evidence became JSONB still have a json column
+        columns = {c["name"]: c for c in inspector.get_columns(SecurityEvent.__tablename__)}
+        if not isinstance(columns["evidence"]["type"], JSONB):
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "ALTER TABLE security_events ALTER COLUMN evidence TYPE jsonb USING evidence::jsonb"
+                ))
+        
+        # Tables created before timestamps became timestamptz hold naive UTC values
+        for table in Base.metadata.sorted_tables:
+            columns = {c["name"]: c for c in inspector.get_columns(table.name)}
+            if columns["timestamp"]["type"].timezone:
+                continue
+            with engine.begin() as conn:
+                if _is_partitioned(conn, table.name):
+                    # The partition key's type can't be altered in place
+                    print(f"Warning: {table.name} is partitioned with a naive timestamp column; "
+                          "leaving it as timestamp (values are read as UTC)")
+                    continue
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN timestamp TYPE timestamptz '
+                    "USING timestamp AT TIME ZONE 'UTC'"
+                ))
+                if table.c.timestamp.server_default is not None:
+                    conn.execute(text(f'ALTER TABLE "{table.name}" ALTER COLUMN timestamp SET DEFAULT now()'))
+        
+        # Tables created before tx hashes became binary store them as hex text.
+        # Values that aren't hashes (agent statuses like "already_paused") can't
+        # be converted: on security_events they move into evidence, as new events
+        # do; elsewhere they become NULL.
+        for table in Base.metadata.sorted_tables:
+            columns = {c["name"]: c for c in inspector.get_columns(table.name)}
+            if "tx_hash" not in columns or isinstance(columns["tx_hash"]["type"], LargeBinary):
+                continue
+            with engine.begin() as conn:
+                if table.name == SecurityEvent.__tablename__:
+                    conn.execute(text(
+                        "UPDATE security_events "
+                        "SET evidence = COALESCE(evidence, '[]'::jsonb) || to_jsonb('tx_status: ' || tx_hash) "
+                        "WHERE tx_hash IS NOT NULL AND tx_hash !~ '^0x[0-9a-fA-F]{64}$'"
+                    ))
+                conn.execute(text(
+                    f'ALTER TABLE "{table.name}" ALTER COLUMN tx_hash TYPE bytea USING '
+                    "CASE WHEN tx_hash ~ '^0x[0-9a-fA-F]{64}$' THEN decode(substr(tx_hash, 3), 'hex') END"
+                ))
+        
+        # Older agent_actions tables enforce tx_hash uniqueness with a B-tree
+        with engine.begin() as conn:
+            if not conn.execute(text(
+                "SELECT 1 FROM pg_constraint WHERE conname = 'ex_agent_actions_tx_hash'"
+            )).first():
+                conn.execute(text("ALTER TABLE agent_actions DROP CONSTRAINT IF EXISTS agent_actions_tx_hash_key"))
+                conn.execute(text(
+                    "ALTER TABLE agent_actions ADD CONSTRAINT ex_agent_actions_tx_hash "
+                    "EXCLUDE USING hash (tx_hash WITH =)"
+                ))
+    
+    # Older indexes superseded by the composite and BRIN ones declared above
+    with engine.begin() as conn:
+        for name in (
+            "ix_security_events_event_type",
+            "ix_security_events_classification",
+            "ix_threat_timeline_timestamp",
+            "ix_market_snapshots_timestamp"
+        ):
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+    
+    # create_all skips existing tables, so add any indexes declared since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    
+    # Backfill the threat timeline once for databases that predate it
+    if new_threat_timeline:
+        with engine.begin() as conn:
+            conn.execute(
+                insert(ThreatTimeline).from_select(
+                    THREAT_TIMELINE_COLUMNS,
+                    select(*(SecurityEvent.__table__.c[name] for name in THREAT_TIMELINE_COLUMNS))
+                    .where(SecurityEvent.classification.isnot(None))
+                    .where(SecurityEvent.classification != "NATURAL")
+                )
+            )
+    
+    # Also re-run hourly by the app (see partition_maintenance in main.py)
+    maintain_partitions(engine)
+    
     return engine
 
 
-async def get_async_session():
-    """Get async database session"""
-    db_url = get_database_url(use_async=True)
-    engine = create_async_engine(db_url, echo=False)
+# One pooled async engine per process; building one per session would open
+# a fresh pool (and fresh connections) for every request
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the shared async engine, creating it on first use"""
+    global _async_engine, _async_session_factory
     
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    if _async_engine is None:
+        db_url = get_database_url(use_async=True)
+        # Batched inserts (event ingestion, create_many) are sent as multi-row
+        # INSERT ... VALUES statements of up to this many rows
+        engine_kwargs = {"echo": False, "insertmanyvalues_page_size": 1000, **JSON_ENGINE_KWARGS}
+        pgbouncer = os.getenv("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
+        if pgbouncer and not db_url.startswith("sqlite"):
+            # PgBouncer transaction mode: PgBouncer does the pooling, and
+            # prepared statements need unique names since server connections
+            # are shared between clients
+            engine_kwargs.update(
+                poolclass=NullPool,
+                connect_args={
+                    "statement_cache_size": 0,
+                    "prepared_statement_cache_size": 0,
+                    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__"
+                }
+            )
+        elif not db_url.startswith("sqlite"):
+            # Size the pool for event ingestion + WebSocket fan-out + stats polling
+            engine_kwargs.update(
+                pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+                max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+                pool_timeout=30,
+                pool_pre_ping=True,
+                pool_recycle=1800
+            )
+        _async_engine = create_async_engine(db_url, **engine_kwargs)
+        if db_url.startswith("sqlite"):
+            event.listen(_async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get the session factory bound to the shared async engine"""
+    get_async_engine()
+    return _async_session_factory
+
+
+# Batches at least this large go through PostgreSQL COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+_POSTGRESQL_DIALECT = postgresql.dialect()
+
+
+def _copy_value(column, row: Dict[str, Any]):
+    """Column value for a COPY record, applying defaults and column type encoding"""
+    value = row.get(column.name)
+    if value is None and column.default is not None:
+        value = column.default.arg(None) if column.default.is_callable else column.default.arg
+    if value is None and isinstance(column.type, UTCDateTime) and column.server_default is not None:
+        # A COPY record can't say DEFAULT; only reached when other rows in the batch set the column
+        value = datetime.now(timezone.utc)
+    if value is not None and isinstance(column.type, JSON):
+        # asyncpg's COPY path takes json columns as text
+        value = orjson.dumps(value).decode()
+    elif value is not None and isinstance(column.type, TypeDecorator):
+        # COPY skips type processing, so apply UTCDateTime/TxHash conversion here
+        value = column.type.process_bind_param(value, _POSTGRESQL_DIALECT)
+    return value
+
+
+async def bulk_insert(session: AsyncSession, model, rows: List[Dict[str, Any]]):
+    """
+    Insert many rows of a model in one go (caller commits)
+    On asyncpg, batches of COPY_THRESHOLD+ rows use COPY, which checks
+    permissions/types once per batch instead of once per row; otherwise a
+    single executemany INSERT
+    """
+    if not rows:
+        return
+    
+    conn = await session.connection()
+    if len(rows) >= COPY_THRESHOLD and conn.dialect.driver == "asyncpg":
+        # Leave the serial id and server-defaulted columns the batch never sets
+        # to the database; explicit keys (threat_timeline.id) are copied as given
+        serial = model.__table__.autoincrement_column
+        columns = [
+            c for c in model.__table__.columns
+            if not ((c is serial or c.server_default is not None)
+                    and all(row.get(c.name) is None for row in rows))
+        ]
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            model.__tablename__,
+            records=[tuple(_copy_value(c, row) for c in columns) for row in rows],
+            columns=[c.name for c in columns]
+        )
+        return
     
-    async with async_session() as session:
-        yield session
+    await session.execute(insert(model), rows)
@@ -68,14 +68,14 @@ async function main() {
     const attackAmount = hre.ethers.parseEther("50");
     console.log(`Attack Amount: 50 WETH`);
     
-    console.log("🪙 Minting attack tokens...");
-    const mintTx = await weth.mint(attacker.address, attackAmount);
-    await mintTx.wait();
-    console.log("✅ Minted 50 WETH");
-    
-    console.log("✅ Approving AMM...");
-    const approveTx = await weth.approve(addresses.AMM, attackAmount);
+    // Mint and approve are independent, so send both with consecutive
+    // nonces and only wait for the approve receipt.
+    console.log("🪙 Minting attack tokens and approving AMM...");
+    let nonce = await attacker.getNonce("pending");
+    await weth.mint(attacker.address, attackAmount, { nonce: nonce++ });
+    const approveTx = await weth.approve(addresses.AMM, attackAmount, { nonce: nonce++ });
     await approveTx.wait();
+    console.log("✅ Minted 50 WETH");
     console.log("✅ Approved");
 
     // Step 3: Signal attack intent (agent might catch this)
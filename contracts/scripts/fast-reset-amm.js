@@ -24,8 +24,15 @@ async function main() {
     const amm = await hre.ethers.getContractAt("SimpleAMM", addresses.AMM);
     const vault = await hre.ethers.getContractAt("LendingVault", addresses.LENDING_VAULT);
 
-    // Check if AMM is paused and unpause if needed
-    const isPaused = await amm.paused();
+    // The three reads are independent; fetch them in one round of RPCs
+    const [isPaused, liquidationsBlocked, reserves] = await Promise.all([
+        amm.paused(),
+        // Ignore if vault doesn't have this method
+        vault.liquidationsBlocked().catch(() => false),
+        amm.getReserves(),
+    ]);
+
+    // Unpause AMM if needed
     if (isPaused) {
         console.log("⚠️ AMM is paused, unpausing first...");
         await (await amm.unpause()).wait();
@@ -33,19 +40,17 @@ async function main() {
     }
 
     // Also unblock liquidations if blocked
-    try {
-        const liquidationsBlocked = await vault.liquidationsBlocked();
-        if (liquidationsBlocked) {
+    if (liquidationsBlocked) {
+        try {
             console.log("⚠️ Liquidations blocked, unblocking...");
             await (await vault.unblockLiquidations()).wait();
             console.log("✅ Liquidations unblocked!");
+        } catch (e) {
+            // Not fatal for the price reset
         }
-    } catch (e) {
-        // Ignore if vault doesn't have this method
     }
 
     // Get current price
-    const reserves = await amm.getReserves();
     const currentWeth = Number(hre.ethers.formatEther(reserves[0]));
     const currentUsdc = Number(hre.ethers.formatUnits(reserves[1], 6));
     const currentPrice = currentUsdc / currentWeth;
@@ -83,9 +88,13 @@ async function main() {
             console.log("💸 Buying WETH with " + usdcNeeded.toFixed(0) + " USDC...");
             const usdcAmount = hre.ethers.parseUnits(Math.ceil(usdcNeeded).toString(), 6);
             
-            await (await usdc.mint(deployer.address, usdcAmount)).wait();
-            await (await usdc.approve(addresses.AMM, usdcAmount)).wait();
-            await (await amm.swapUsdcForWeth(usdcAmount)).wait();
+            // Send mint/approve/swap back-to-back with consecutive nonces and
+            // only wait for the swap; the chain mines them in nonce order.
+            let nonce = await deployer.getNonce("pending");
+            await usdc.mint(deployer.address, usdcAmount, { nonce: nonce++, gasLimit: 100000 });
+            await usdc.approve(addresses.AMM, usdcAmount, { nonce: nonce++, gasLimit: 100000 });
+            const swapTx = await amm.swapUsdcForWeth(usdcAmount, { nonce: nonce++, gasLimit: 500000 });
+            await swapTx.wait();
         }
     } else {
         // Price too high - sell WETH
@@ -99,9 +108,11 @@ async function main() {
             console.log("💸 Selling " + wethNeeded.toFixed(2) + " WETH...");
             const wethAmount = hre.ethers.parseEther(Math.ceil(wethNeeded).toString());
             
-            await (await weth.mint(deployer.address, wethAmount)).wait();
-            await (await weth.approve(addresses.AMM, wethAmount)).wait();
-            await (await amm.swapWethForUsdc(wethAmount)).wait();
+            let nonce = await deployer.getNonce("pending");
+            await weth.mint(deployer.address, wethAmount, { nonce: nonce++, gasLimit: 100000 });
+            await weth.approve(addresses.AMM, wethAmount, { nonce: nonce++, gasLimit: 100000 });
+            const swapTx = await amm.swapWethForUsdc(wethAmount, { nonce: nonce++, gasLimit: 500000 });
+            await swapTx.wait();
         }
     }
 
@@ -26,63 +26,69 @@ async function main() {
     console.log("\n📋 Current State:");
     console.log("━".repeat(40));
     
-    let ammPaused = await amm.paused();
-    let vaultPaused = await vault.paused();
-    let liqBlocked = await vault.liquidationsBlocked();
+    let [ammPaused, vaultPaused, liqBlocked] = await Promise.all([
+        amm.paused(),
+        vault.paused(),
+        vault.liquidationsBlocked(),
+    ]);
     
     console.log(`AMM Paused: ${ammPaused}`);
     console.log(`Vault Paused: ${vaultPaused}`);
     console.log(`Liquidations Blocked: ${liqBlocked}`);
 
-    // Unpause AMM
+    // Queue the needed recovery transactions. They are all sent from the
+    // owner, so nonces are assigned up front and the transactions are
+    // broadcast back-to-back instead of waiting for each receipt in turn.
+    const steps = [];
     if (ammPaused) {
-        console.log("\n📤 Unpausing AMM...");
-        try {
-            const tx = await amm.unpause();
-            await tx.wait();
-            console.log("✅ AMM unpaused!");
-        } catch (error) {
-            console.log("❌ Failed to unpause AMM:", error.message.split('\n')[0]);
-        }
+        steps.push({ label: "AMM unpaused", failure: "unpause AMM", send: (overrides) => amm.unpause(overrides) });
     } else {
         console.log("\nℹ️ AMM already unpaused");
     }
-
-    // Unpause Vault
     if (vaultPaused) {
-        console.log("📤 Unpausing Vault...");
-        try {
-            const tx = await vault.unpause();
-            await tx.wait();
-            console.log("✅ Vault unpaused!");
-        } catch (error) {
-            console.log("❌ Failed to unpause Vault:", error.message.split('\n')[0]);
-        }
+        steps.push({ label: "Vault unpaused", failure: "unpause Vault", send: (overrides) => vault.unpause(overrides) });
     } else {
         console.log("ℹ️ Vault already unpaused");
     }
-
-    // Unblock liquidations
     if (liqBlocked) {
-        console.log("📤 Unblocking liquidations...");
-        try {
-            const tx = await vault.unblockLiquidations();
-            await tx.wait();
-            console.log("✅ Liquidations unblocked!");
-        } catch (error) {
-            console.log("❌ Failed to unblock liquidations:", error.message.split('\n')[0]);
-        }
+        steps.push({ label: "Liquidations unblocked", failure: "unblock liquidations", send: (overrides) => vault.unblockLiquidations(overrides) });
     } else {
         console.log("ℹ️ Liquidations already unblocked");
     }
 
+    if (steps.length > 0) {
+        console.log(`\n📤 Sending ${steps.length} recovery transaction(s)...`);
+        let nonce = await owner.getNonce("pending");
+        const pending = [];
+        for (const step of steps) {
+            try {
+                const tx = await step.send({ nonce });
+                nonce++;
+                pending.push(tx.wait());
+            } catch (error) {
+                pending.push(Promise.reject(error));
+            }
+        }
+
+        const results = await Promise.allSettled(pending);
+        results.forEach((result, i) => {
+            if (result.status === "fulfilled") {
+                console.log(`✅ ${steps[i].label}!`);
+            } else {
+                console.log(`❌ Failed to ${steps[i].failure}:`, result.reason.message.split('\n')[0]);
+            }
+        });
+    }
+
     // Verify final state
     console.log("\n📋 Final State:");
     console.log("━".repeat(40));
     
-    ammPaused = await amm.paused();
-    vaultPaused = await vault.paused();
-    liqBlocked = await vault.liquidationsBlocked();
+    [ammPaused, vaultPaused, liqBlocked] = await Promise.all([
+        amm.paused(),
+        vault.paused(),
+        vault.liquidationsBlocked(),
+    ]);
     
     console.log(`AMM Paused: ${ammPaused}`);
     console.log(`Vault Paused: ${vaultPaused}`);
@@ -72,10 +72,7 @@ echo "Building backend..."
 docker build -t $REGISTRY/backend:latest -f deploy/Dockerfile.backend ..
 docker push $REGISTRY/backend:latest
 
-# Frontend
-echo "Building frontend..."
-docker build -t $REGISTRY/frontend:latest -f deploy/Dockerfile.frontend ..
-docker push $REGISTRY/frontend:latest
+# Frontend is built after the backend is deployed (it needs the backend URL)
 
 # Agent
 echo "Building agent..."
@@ -133,6 +130,16 @@ gcloud run deploy amen-backend \
 # Get backend URL
 BACKEND_URL=$(gcloud run services describe amen-backend --region=$REGION --format='value(status.url)')
 echo "Backend URL: $BACKEND_URL"
+# The dashboard's live stats come over the backend's /ws (the frontend nginx doesn't proxy it)
+BACKEND_WS_URL="$(echo "$BACKEND_URL" | sed -e 's#^https://#wss://#' -e 's#^http://#ws://#')/ws"
+
+# Build Frontend (Vite inlines VITE_* at build time, so they are build args)
+echo "Building frontend..."
+docker build -t $REGISTRY/frontend:latest -f deploy/Dockerfile.frontend \
+    --build-arg VITE_API_URL=$BACKEND_URL \
+    --build-arg VITE_WS_URL=$BACKEND_WS_URL \
+    ..
+docker push $REGISTRY/frontend:latest
 
 # Deploy Frontend
 echo "Deploying frontend..."
@@ -145,8 +152,7 @@ gcloud run deploy amen-frontend \
     --cpu=1 \
     --min-instances=0 \
     --max-instances=5 \
-    --port=80 \
-    --set-env-vars="VITE_API_URL=$BACKEND_URL"
+    --port=80
 
 FRONTEND_URL=$(gcloud run services describe amen-frontend --region=$REGION --format='value(status.url)')
 
@@ -39,6 +39,9 @@ import {
   simulateAttack
 } from './api';
 
+// Stats fallback poll while live stats come over the WebSocket
+const STATS_FALLBACK_POLL_MS = 15000;
+
 // =============================================================================
 // COMPONENTS
 // =============================================================================
@@ -615,28 +618,14 @@ function AgentReasoning({ event, latestThreat, stats }: {
   latestThreat?: ThreatEntry | null;
   stats?: DashboardStats | null;
 }) {
-  const [liveStats, setLiveStats] = useState<DashboardStats | null>(stats || null);
   const [lastRefresh, setLastRefresh] = useState<Date>(new Date());
   
-  // Poll for live stats every 2 seconds for real-time updates
+  // Stats are pushed to the parent over the WebSocket; track when they last changed
   useEffect(() => {
-    const fetchLive = async () => {
-      try {
-        const freshStats = await fetchStats();
-        setLiveStats(freshStats);
-        setLastRefresh(new Date());
-      } catch (e) {
-        console.error('Live fetch failed:', e);
-      }
-    };
-    
-    fetchLive();
-    const interval = setInterval(fetchLive, 1000); // 1 second refresh for faster UI updates
-    return () => clearInterval(interval);
-  }, []);
+    if (stats) setLastRefresh(new Date());
+  }, [stats]);
   
-  // Use live stats if available, otherwise fallback to props
-  const currentStats = liveStats || stats;
+  const currentStats = stats;
   
   // Get deviation - backend returns it as percentage already (e.g., 0.15 = 0.15%)
   const deviationPercent = Math.abs(currentStats?.price_deviation || 0);
@@ -902,18 +891,16 @@ function App() {
     setTimeout(() => setActionResult(null), 10000);
   };
 
-  // Fetch data
+  // Fetch data (stats are pushed over the WebSocket, see below)
   const fetchData = useCallback(async () => {
     try {
-      const [statsData, pricesData, threatsData, actionsData, eventsData] = await Promise.all([
-        fetchStats(),
+      const [pricesData, threatsData, actionsData, eventsData] = await Promise.all([
         fetchPriceHistory(1),
         fetchThreats(20),
         fetchActions(10),
         fetchEvents(10)
       ]);
       
-      setStats(statsData);
       setPriceData(pricesData);
       setThreats(threatsData);
       setActions(actionsData);
@@ -935,15 +922,28 @@ function App() {
 
   // Initial fetch and polling
   useEffect(() => {
+    // Live stats arrive as WebSocket "stats" messages; the slow REST poll
+    // (a 304 when nothing changed) covers drops and on-chain changes made
+    // outside the backend
+    const loadStats = () =>
+      fetchStats().then(setStats).catch((error) => console.error('Failed to fetch stats:', error));
+    loadStats();
+    const statsInterval = setInterval(loadStats, STATS_FALLBACK_POLL_MS);
+    
     fetchData();
     const interval = setInterval(fetchData, 2000); // 2 second refresh for faster updates
-    return () => clearInterval(interval);
+    return () => {
+      clearInterval(interval);
+      clearInterval(statsInterval);
+    };
   }, [fetchData]);
 
   // WebSocket connection
   useEffect(() => {
     const ws = createWebSocket((data) => {
-      if (data.type === 'new_event') {
+      if (data.type === 'stats') {
+        setStats(data.data);
+      } else if (data.type === 'new_event') {
         // Refresh data on new events
         fetchData();
       }
@@ -87,68 +87,103 @@ export async function fetchActions(limit: number = 20): Promise<SecurityEvent[]>
   return response.json();
 }
 
-// Redeploy AMM (reset to $2000)
-export async function redeployAMM(): Promise<{ success: boolean; message: string; tx_hash?: string; new_price?: number }> {
-  const response = await fetch(`${API_BASE}/api/admin/redeploy-amm`, {
+// Admin scripts run as background jobs: start one, then poll until it finishes
+async function runAdminJob<T>(path: string, errorMessage: string): Promise<T> {
+  const response = await fetch(`${API_BASE}${path}`, {
     method: 'POST',
     headers: { 'Content-Type': 'application/json' }
   });
-  if (!response.ok) throw new Error('Failed to redeploy AMM');
-  return response.json();
+  if (!response.ok) throw new Error(errorMessage);
+  const { job_id } = await response.json();
+
+  while (true) {
+    await new Promise((resolve) => setTimeout(resolve, 1000));
+    const poll = await fetch(`${API_BASE}/api/admin/job/${job_id}`);
+    if (!poll.ok) throw new Error(errorMessage);
+    const job = await poll.json();
+    if (job.status !== 'pending') return job.result;
+  }
+}
+
+// Redeploy AMM (reset to $2000)
+export async function redeployAMM(): Promise<{ success: boolean; message: string; tx_hash?: string; new_price?: number }> {
+  return runAdminJob('/api/admin/redeploy-amm', 'Failed to redeploy AMM');
 }
 
 // Simulate attack
 export async function simulateAttack(): Promise<{ success: boolean; message: string; blocked: boolean; tx_hash?: string; price_before?: number; price_after?: number }> {
-  const response = await fetch(`${API_BASE}/api/admin/simulate-attack`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/json' }
-  });
-  if (!response.ok) throw new Error('Failed to simulate attack');
-  return response.json();
+  return runAdminJob('/api/admin/simulate-attack', 'Failed to simulate attack');
 }
 
 export async function resetAMM(): Promise<{ success: boolean; message: string; new_price?: number; tx_hash?: string }> {
-  const response = await fetch(`${API_BASE}/api/admin/reset-amm`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/json' }
-  });
-  if (!response.ok) throw new Error('Failed to reset AMM');
-  return response.json();
+  return runAdminJob('/api/admin/reset-amm', 'Failed to reset AMM');
+}
+
+// WebSocket reconnect backoff: doubles from the minimum up to the maximum
+const WS_RETRY_MIN_MS = 1000;
+const WS_RETRY_MAX_MS = 30000;
+
+export interface LiveConnection {
+  close: () => void;
 }
 
-// WebSocket connection
-export function createWebSocket(onMessage: (data: any) => void): WebSocket {
+// WebSocket connection; reconnects with backoff until close() is called
+export function createWebSocket(onMessage: (data: any) => void): LiveConnection {
   // Use relative path for websocket (goes through vite proxy)
   const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
   const wsUrl = import.meta.env.VITE_WS_URL || `${protocol}//${window.location.host}/ws`;
-  const ws = new WebSocket(wsUrl);
   
-  ws.onmessage = (event) => {
-    try {
-      const data = JSON.parse(event.data);
-      onMessage(data);
-    } catch (e) {
-      console.error('Failed to parse WebSocket message:', e);
-    }
-  };
+  let ws: WebSocket | null = null;
+  let pingTimer: ReturnType<typeof setInterval> | undefined;
+  let retryTimer: ReturnType<typeof setTimeout> | undefined;
+  let retryDelay = WS_RETRY_MIN_MS;
+  let closed = false;
   
-  ws.onopen = () => {
-    console.log('WebSocket connected');
-    // Start ping interval
-    setInterval(() => {
-      if (ws.readyState === WebSocket.OPEN) {
-        ws.send('ping');
+  const connect = () => {
+    ws = new WebSocket(wsUrl);
+    
+    ws.onmessage = (event) => {
+      if (event.data === 'pong') return;
+      try {
+        const data = JSON.parse(event.data);
+        onMessage(data);
+      } catch (e) {
+        console.error('Failed to parse WebSocket message:', e);
       }
-    }, 30000);
+    };
+    
+    ws.onopen = () => {
+      console.log('WebSocket connected');
+      retryDelay = WS_RETRY_MIN_MS;
+      // Start ping interval
+      pingTimer = setInterval(() => {
+        if (ws?.readyState === WebSocket.OPEN) {
+          ws.send('ping');
+        }
+      }, 30000);
+    };
+    
+    ws.onerror = (error) => {
+      console.error('WebSocket error:', error);
+    };
+    
+    ws.onclose = (event) => {
+      clearInterval(pingTimer);
+      if (closed) return;
+      console.log(`WebSocket disconnected (code ${event.code}), reconnecting in ${retryDelay}ms`);
+      retryTimer = setTimeout(connect, retryDelay);
+      retryDelay = Math.min(retryDelay * 2, WS_RETRY_MAX_MS);
+    };
   };
   
-  ws.onerror = (error) => {
-    console.error('WebSocket error:', error);
-  };
+  connect();
   
-  ws.onclose = () => {
-    console.log('WebSocket disconnected');
+  return {
+    close: () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      clearInterval(pingTimer);
+      ws?.close();
+    }
   };
-  
-  return ws;
 }
@@ -4,6 +4,7 @@ Checks all components are properly configured
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -15,15 +16,35 @@ def check_env_file(path, required_vars):
     with open(path, 'r') as f:
         content = f.read()
     
-    missing = []
-    for var in required_vars:
-        if var not in content:
-            missing.append(var)
+    # One pass over the file for all keys; anchoring on "NAME =" also stops
+    # VITE_API_URL_OLD or a mention in a comment from counting as VITE_API_URL
+    pattern = re.compile(
+        r"^\s*(?:export\s+)?(" + "|".join(re.escape(v) for v in required_vars) + r")\s*=",
+        re.MULTILINE
+    )
+    found = set(pattern.findall(content))
+    missing = [var for var in required_vars if var not in found]
     
     if missing:
         return False, f"Missing variables: {', '.join(missing)}"
     return True, "OK"
 
+def find_existing(root, paths):
+    """Return the subset of paths (relative to root) that are existing files, listing each directory once"""
+    by_dir = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        by_dir.setdefault(parent, {})[name] = path
+    
+    present = set()
+    for parent, names in by_dir.items():
+        try:
+            with os.scandir(root / parent) as entries:
+                present.update(names[e.name] for e in entries if e.name in names and e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return present
+
 def main():
     print("=" * 60)
     print("AMEN System Verification")
@@ -88,8 +109,9 @@ def main():
         "contracts/src/amm/SimpleAMM.sol",
         "contracts/src/lending/LendingVault.sol"
     ]
+    present = find_existing(root, contracts)
     for contract in contracts:
-        exists = (root / contract).exists()
+        exists = contract in present
         print(f"   {'✅' if exists else '❌'} {contract}")
         if not exists:
             all_ok = False
@@ -106,8 +128,9 @@ def main():
         "agent/config.py",
         "agent/abis.py"
     ]
+    present = find_existing(root, agent_files)
     for f in agent_files:
-        exists = (root / f).exists()
+        exists = f in present
         print(f"   {'✅' if exists else '❌'} {f}")
         if not exists:
             all_ok = False
@@ -119,8 +142,9 @@ def main():
         "backend/models.py",
         "backend/requirements.txt"
     ]
+    present = find_existing(root, backend_files)
     for f in backend_files:
-        exists = (root / f).exists()
+        exists = f in present
         print(f"   {'✅' if exists else '❌'} {f}")
         if not exists:
             all_ok = False
@@ -133,8 +157,9 @@ def main():
         "frontend/package.json",
         "frontend/vite.config.ts"
     ]
+    present = find_existing(root, frontend_files)
     for f in frontend_files:
-        exists = (root / f).exists()
+        exists = f in present
         print(f"   {'✅' if exists else '❌'} {f}")
         if not exists:
             all_ok = False